@@ -0,0 +1,337 @@
+from typing import Iterable, Optional
+from logging import Logger
+import tempfile
+import json
+import os
+
+import Utils
+from NetUtils import NetworkItem
+
+from .data.Strings import Meta, APConsole
+
+
+### [< --- SESSION CACHE --- >]
+class AE3SessionCache:
+    """
+    Local record of the progress of a single slot, kept on disk so that reconnecting or restarting the client
+    mid-session does not require rebuilding everything from the emulator's memory.
+
+    Checked Locations are stored as a bitset relative to the lowest Location ID.
+    """
+    version : int = 1
+
+    path : str
+    base_id : int
+    logger : Logger
+
+    checked : set[int]
+    last_item_index : int = -1
+    keys : int = 0
+    shop_progress : int = -1
+    pgc : bool = False
+
+    exists : bool = False
+    is_dirty : bool = False
+
+    def __init__(self, logger : Logger, seed_name : str, team : int, slot : int, location_ids : Iterable[int]):
+        self.logger = logger
+        self.path = Utils.cache_path(Meta.game_acr, f"{seed_name}_{team}_{slot}.json")
+        self.base_id = min(location_ids)
+
+        self.checked = set()
+
+    # { Encoding }
+    def encode_checked(self) -> str:
+        if not self.checked:
+            return ""
+
+        bits : bytearray = bytearray((max(self.checked) - self.base_id) // 8 + 1)
+        for location_id in self.checked:
+            offset : int = location_id - self.base_id
+            bits[offset >> 3] |= 1 << (offset & 7)
+
+        return bits.hex()
+
+    def decode_checked(self, encoded : str) -> set[int]:
+        checked : set[int] = set()
+        for i, byte in enumerate(bytes.fromhex(encoded)):
+            for bit in range(8):
+                if byte & (1 << bit):
+                    checked.add(self.base_id + (i << 3) + bit)
+
+        return checked
+
+    # { Storage }
+    def load(self) -> bool:
+        """Read the cache file for this slot if there is one. Returns whether anything was loaded."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data : dict = json.load(file)
+
+            if data.get("version") != self.version:
+                return False
+
+            self.checked = self.decode_checked(data["checked"])
+            self.last_item_index = data["last_item_index"]
+            self.keys = data["keys"]
+            self.shop_progress = data["shop_progress"]
+            self.pgc = data["pgc"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self.exists = True
+        self.is_dirty = False
+        return True
+
+    def save(self):
+        """Write the cache to disk if it has changed. The file is replaced atomically so it is never left partial."""
+        if not self.is_dirty:
+            return
+
+        data : dict = {
+            "version": self.version,
+            "checked": self.encode_checked(),
+            "last_item_index": self.last_item_index,
+            "keys": self.keys,
+            "shop_progress": self.shop_progress,
+            "pgc": self.pgc,
+        }
+
+        directory : str = os.path.dirname(self.path)
+        temp_path : Optional[str] = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp",
+                                             delete=False) as file:
+                temp_path = file.name
+                json.dump(data, file, separators=(",", ":"))
+
+            os.replace(temp_path, self.path)
+        except OSError:
+            self.logger.warning(APConsole.Err.cache_fail.value)
+
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        self.exists = True
+        self.is_dirty = False
+
+    # { Updates }
+    def update(self, checked : Iterable[int], last_item_index : int, keys : int, shop_progress : int, pgc : bool):
+        """Record the latest progress, marking the cache for saving only if anything differs."""
+        checked = set(checked)
+        if not checked.issubset(self.checked):
+            self.checked.update(checked)
+            self.is_dirty = True
+
+        if (last_item_index, keys, shop_progress, pgc) != (self.last_item_index, self.keys, self.shop_progress,
+                                                           self.pgc):
+            self.last_item_index = last_item_index
+            self.keys = keys
+            self.shop_progress = shop_progress
+            self.pgc = pgc
+            self.is_dirty = True
+
+
+### [< --- OFFLINE JOURNAL --- >]
+class AE3OfflineJournal:
+    """
+    Append-only record of Locations checked while disconnected from the server, kept on disk so none are lost if the
+    client closes before reconnecting. Entries are tagged with the slot they were checked for, and are only dropped
+    once the server acknowledges them as checked.
+
+    The journal is shared by every session and every client, so each only ever rewrites the entries of its own slot.
+    """
+    path : str
+    logger : Logger
+
+    # Pending Location IDs, keyed by (seed name, team, slot)
+    pending : dict[tuple[str, int, int], set[int]]
+    in_flight : set[int]
+
+    def __init__(self, logger : Logger):
+        self.logger = logger
+        self.path = Utils.cache_path(Meta.game_acr, "offline_checks.jsonl")
+
+        self.pending = {}
+        self.in_flight = set()
+
+    def __bool__(self) -> bool:
+        return any(self.pending.values())
+
+    @staticmethod
+    def to_key(seed_name : Optional[str], team : Optional[int], slot : Optional[int]) \
+            -> Optional[tuple[str, int, int]]:
+        if seed_name is None or team is None or slot is None:
+            return None
+
+        return seed_name, team, slot
+
+    # { Storage }
+    def read(self) -> list[tuple[str, Optional[tuple[str, int, int]], list[int]]]:
+        """
+        Read the journal from disk as its lines, along with the slot and Locations of each. Lines that cannot be read,
+        such as one cut off by a crash, are skipped.
+        """
+        entries : list[tuple[str, Optional[tuple[str, int, int]], list[int]]] = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry : dict = json.loads(line)
+                        key = self.to_key(entry.get("seed"), entry.get("team"), entry.get("slot"))
+                        entries.append((line if line.endswith("\n") else line + "\n", key, [*entry["locations"]]))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+
+        return entries
+
+    def load(self):
+        """Replay the journal from disk. Entries without a slot cannot be told apart between seeds, and are ignored."""
+        for _, key, locations in self.read():
+            if key is not None:
+                self.pending.setdefault(key, set()).update(locations)
+
+    def write(self, lines : list[str], mode : str):
+        directory : str = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            # Appends are small enough to be written directly, while rewrites replace the file atomically
+            if mode == "a":
+                with open(self.path, "a", encoding="utf-8") as file:
+                    file.writelines(lines)
+                    file.flush()
+                    os.fsync(file.fileno())
+                return
+
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp",
+                                             delete=False) as file:
+                file.writelines(lines)
+
+            os.replace(file.name, self.path)
+        except OSError:
+            self.logger.warning(APConsole.Err.cache_fail.value)
+
+    @staticmethod
+    def to_line(key : tuple[str, int, int], locations : Iterable[int]) -> str:
+        seed_name, team, slot = key
+        return json.dumps({"seed": seed_name, "team": team, "slot": slot, "locations": sorted(locations)},
+                          separators=(",", ":")) + "\n"
+
+    # { Updates }
+    def record(self, locations : set[int], key : Optional[tuple[str, int, int]]):
+        """
+        Append newly checked Locations of a slot to the journal, ignoring any already pending. Without a slot, nothing
+        is recorded, as the checks remain in the game's memory and are found again once a slot connects.
+        """
+        if key is None:
+            return
+
+        pending : set[int] = self.pending.setdefault(key, set())
+
+        new : set[int] = locations.difference(pending)
+        if not new:
+            return
+
+        pending.update(new)
+        self.write([self.to_line(key, new)], "a")
+
+    def get_unsent(self, key : tuple[str, int, int]) -> set[int]:
+        """Get pending Locations for the given slot that have not yet been sent during this connection."""
+        return self.pending.get(key, set()).difference(self.in_flight)
+
+    def mark_sent(self, locations : set[int]):
+        self.in_flight.update(locations)
+
+    def reset_sent(self):
+        """Allow unacknowledged Locations to be sent again, such as after reconnecting."""
+        self.in_flight.clear()
+
+    def acknowledge(self, locations : set[int], key : tuple[str, int, int]):
+        """Drop Locations the server has confirmed as checked, compacting the journal if anything changed."""
+        if key not in self.pending or self.pending[key].isdisjoint(locations):
+            return
+
+        self.pending[key].difference_update(locations)
+        if not self.pending[key]:
+            del self.pending[key]
+
+        self.in_flight.difference_update(locations)
+
+        # Only the lines of this slot are rewritten. Lines of any other slot are kept exactly as they are on disk,
+        # as other sessions and clients may have appended to or compacted them since this journal was loaded
+        lines : list[str] = []
+        for line, line_key, line_locations in self.read():
+            # Lines without a slot cannot be sent safely, and are dropped
+            if line_key is None:
+                continue
+
+            if line_key != key:
+                lines.append(line)
+                continue
+
+            remaining : list[int] = [location for location in line_locations if location not in locations]
+            if remaining:
+                lines.append(self.to_line(key, remaining))
+
+        self.write(lines, "w")
+
+
+### [< --- HINT CACHE --- >]
+class AE3HintCache:
+    """
+    Hint targets of Hint Books and Progressive Hints for a single slot, along with what has been scouted of them and
+    which have already been hinted, so that hints can be shown right away and are not requested more than once.
+
+    Only targets in the slot's own world can be scouted, as the server only answers scouts for the requesting slot.
+    """
+    slot : int
+
+    # Hint Book Location ID -> (player, Location ID)
+    books : dict[int, tuple[int, int]]
+    progressive : list[tuple[int, int]]
+
+    scouted : dict[int, NetworkItem]
+    hinted : set[tuple[int, int]]
+    is_scout_sent : bool = False
+
+    def __init__(self, slot : int, pre_hinted : dict):
+        self.slot = slot
+
+        self.books = {}
+        self.progressive = []
+        for key, target in pre_hinted.items():
+            if key == 0:
+                self.progressive = [(entry["player"], entry["id"]) for entry in target]
+            else:
+                self.books[key] = (target["player"], target["id"])
+
+        self.scouted = {}
+        self.hinted = set()
+
+    def get_scout_targets(self) -> set[int]:
+        """Get the Locations of this slot that are hint targets and have yet to be scouted."""
+        return {location_id for player, location_id in (*self.books.values(), *self.progressive)
+                if player == self.slot and location_id not in self.scouted}
+
+    def store(self, items : Iterable[NetworkItem]):
+        for item in items:
+            self.scouted[item.location] = item
+
+    def get(self, location_id : int) -> Optional[NetworkItem]:
+        return self.scouted.get(location_id)
+
+    def claim(self, player : int, locations : Iterable[int]) -> set[int]:
+        """Get the Locations that have not been hinted yet for the player, marking them as hinted."""
+        unhinted : set[int] = {location_id for location_id in locations if (player, location_id) not in self.hinted}
+        self.hinted.update((player, location_id) for location_id in unhinted)
+
+        return unhinted
+
+    def release(self, player : int, locations : Iterable[int]):
+        """Allow Locations to be hinted again, such as when their hints could not be sent."""
+        self.hinted.difference_update((player, location_id) for location_id in locations)
@@ -1,23 +1,30 @@
 from argparse import ArgumentParser, Namespace
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
+from collections import Counter
 import typing
 import multiprocessing
 import traceback
 import platform
 import asyncio
+import logging
+import json
 import sys
+import os
 
 from CommonClient import ClientStatus, logger, handle_url_arg
+from NetUtils import NetworkItem
 from settings import get_settings
 import Utils
 
 from .data.Strings import Meta, APConsole
 from .data.Logic import ProgressionMode, ProgressionModeOptions
-from .data.Locations import MONKEYS_MASTER, MONKEYS_MASTER_ORDERED, CAMERAS_MASTER_ORDERED, CELLPHONES_MASTER_ORDERED, \
-    SHOP_PROGRESSION_75COMPLETION, SHOP_EVENT_ACCESS_DIRECTORY, SHOP_COLLECTION_MASTER, SHOP_UNIQUE_MASTER
+from .data.Locations import MONKEYS_MASTER, SHOP_PROGRESSION_75COMPLETION, SHOP_EVENT_ACCESS_DIRECTORY, \
+    SHOP_COLLECTION_MASTER, SHOP_UNIQUE_MASTER
 from .data.Stages import STAGES_BREAK_ROOMS, LEVELS_BY_ORDER
-from .data.Rules import GoalTarget, GoalTargetOptions, PostGameCondition
+from .data.Rules import GoalTarget, GoalTargetOptions, PostGameCondition, ProgressTracker
 from .AE3_Interface import ConnectionStatus, AEPS2Interface
+from .AE3_Cache import AE3SessionCache, AE3OfflineJournal, AE3HintCache
+from .AE3_Consolation import LocationPool
 from . import AE3Settings
 from .Checker import *
 from .data import Items, Locations
@@ -31,19 +38,59 @@ try:
 except ImportError:
     pass
 
+# Headless Mode skips loading the tracker and any interface, and must be known before the client is imported.
+# When launched from the Launcher, it is passed for the import only, as the Launcher's own arguments do not apply
+if "AE3_CLIENT_HEADLESS" in os.environ:
+    headless_requested: bool = os.environ["AE3_CLIENT_HEADLESS"] == "1"
+else:
+    headless_requested: bool = "--headless" in sys.argv
+
 # Try to load Universal Tracker if present
 tracker_loaded: bool = False
-try:
-    from worlds.tracker.TrackerClient import (ClientCommandProcessor, TrackerGameContext as SuperContext,
-                                              get_base_parser, server_loop)
-    tracker_loaded = True
+if not headless_requested:
+    try:
+        from worlds.tracker.TrackerClient import (ClientCommandProcessor, TrackerGameContext as SuperContext,
+                                                  get_base_parser, server_loop)
+        tracker_loaded = True
 
-    if not gui_loaded_from_utils: from worlds.tracker.TrackerClient import gui_enabled
-except ImportError:
+        if not gui_loaded_from_utils: from worlds.tracker.TrackerClient import gui_enabled
+    except ImportError:
+        pass
+
+if not tracker_loaded:
     from CommonClient import (ClientCommandProcessor, CommonContext as SuperContext, get_base_parser, server_loop)
     if not gui_loaded_from_utils: from CommonClient import gui_enabled
 
 
+class JSONLogFormatter(logging.Formatter):
+    """Formats log records as single line JSON objects, for unattended runs in Headless Mode."""
+    def format(self, record : logging.LogRecord) -> str:
+        entry : dict = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage().strip(),
+        }
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry)
+
+
+class LazyTable:
+    """Class-level table that is only built when first accessed, and is then shared by every instance."""
+    def __init__(self, build : typing.Callable[[], typing.Any]):
+        self.build = build
+        self.table = None
+
+    def __get__(self, instance, owner):
+        if self.table is None:
+            self.table = self.build()
+
+        return self.table
+
+
 class AE3CommandProcessor(ClientCommandProcessor):
     def __init__(self, ctx: SuperContext):
         super().__init__(ctx)
@@ -435,6 +482,7 @@ class AE3Context(SuperContext):
     platform: str = Meta.platform
 
     # Client Properties
+    is_logging_initialized : bool = False
     command_processor : ClientCommandProcessor = AE3CommandProcessor
     tags: set[str] = {"AP"}
     items_handling : int = 0b111
@@ -445,6 +493,11 @@ class AE3Context(SuperContext):
     has_archipelago_package: bool = False
     has_just_connected : bool = False
     interface_sync_task : asyncio.tasks = None
+    deathlink_watch_task : asyncio.tasks = None
+    deathlink_watch_interval : float = 0.1
+    headless : bool = False
+    tick_interval : float = 0.5
+    last_tick : float = 0.0
     last_message : Optional[str] = None
 
     # Server Properties and Cache
@@ -457,23 +510,41 @@ class AE3Context(SuperContext):
     pending_deathlinks : int = 0
     pending_resync : bool = False
     cached_locations_checked : Set[int]
-    offline_locations_checked : Set[int] = set()
-    monkeys_index : list[Sequence[str]] = []
+    offline_journal : AE3OfflineJournal
+    # Slot of the last connection, kept when disconnected so that checks made offline are journaled for it
+    last_slot_key : Optional[tuple[str, int, int]] = None
+
+    ## Outbound messages are held briefly so that they can be merged and sent in a single frame
+    outbound_locations : Set[int]
+    outbound_hints : dict[int, Set[int]]
+    outbound_sets : dict[str, dict]
+    outbound_flush_task : Optional[asyncio.Task] = None
+    outbound_window : float = 0.05
+    items_received_counts : Counter[int]
+    items_received_counted : int = 0
+    session_cache : Optional[AE3SessionCache] = None
+    monkeys_index : list[Sequence[str]]
 
     should_deathlink_tag_update : bool = False
 
     # APWorld Properties
-    locations_name_to_id : dict[str, int] = Locations.generate_name_to_id()
-    active_locations: set[str] = set(locations_name_to_id.keys()).difference(MONKEYS_PASSWORDS)
-    items_name_to_id : dict[str, int] = Items.generate_name_to_id()
-    location_groups : list[list[str]] = [[*locations] for locations in LOCATIONS_INDEX.values()]
+    ## Tables are shared between all sessions and must not be modified. They are only built when first needed,
+    ## so that they do not delay the start of the client
+    locations_name_to_id : typing.Mapping[str, int] = LazyTable(lambda: Locations.get_location_tables().name_to_id)
+    items_name_to_id : dict[str, int] = LazyTable(Items.generate_name_to_id)
+    location_groups : list[list[str]] = LazyTable(lambda: [[*locations] for locations in LOCATIONS_INDEX.values()])
+
+    active_locations: set[str]
+    consolation_pool : LocationPool
     group_check_index : int = 0
 
-    cache_missing : list[list[str]] = location_groups.copy()
+    cache_missing : list[list[str]]
     is_cache_built : bool = False
     monkeys_checklist : Sequence[str] = MONKEYS_MASTER
     monkeys_checklist_count : int = 0
-    pre_hinted: dict = {}
+    pre_hinted: dict
+    hint_cache : AE3HintCache
+    hint_caches : dict[tuple[str, int, int], AE3HintCache]
 
     # Session Properties
     keys : int = 0
@@ -487,8 +558,10 @@ class AE3Context(SuperContext):
     is_using_data_desk: bool = False
     in_shopping_area : bool = False
     is_shop_ready: bool = False
-    has_bought_ticket: bool = False
+    shop_state : ShopState = ShopState.NONE
+    shop_key : Optional[tuple] = None
     last_selected_channel_index : int = -1
+    level_select_key : Optional[tuple] = None
     suppress_progress_correction : bool = False
     character : int = -1
     player_control : bool = False
@@ -531,9 +604,10 @@ class AE3Context(SuperContext):
 
     # Player Set Options
     progression : ProgressionMode = ProgressionModeOptions[0]
-    goal_target : GoalTarget = GoalTarget()
+    goal_target : GoalTarget
     post_game_access_rule_option : int = 0
     post_game_condition : PostGameCondition = None
+    progress : ProgressTracker
     shuffle_channel : bool = False
     dummy_morph : str = Itm.morph_monkey.value
     check_break_rooms : bool = False
@@ -547,21 +621,14 @@ class AE3Context(SuperContext):
     extra_shop_stocks : int = 0
 
     morph_duration : float = 0.0
+    applied_morph_durations : dict[int, tuple[float, ...]]
     shuffle_chassis: bool = False
     shuffle_morph_stock: bool = False
 
     early_free_play : bool = False
     monkey_mart : bool = True
     ticket_consolation: bool = True
-    consolation_whitelist: list[str] = [
-        APHelper.nothing.value,
-        APHelper.hint_filler.value,
-        APHelper.hint_progressive.value,
-        APHelper.check_filler.value,
-        APHelper.check_progressive.value,
-        APHelper.check_pgc.value,
-        APHelper.check_gt.value,
-    ]
+    consolation_whitelist: list[str]
 
     state_slot : int = -1
     death_link : bool = False
@@ -570,11 +637,42 @@ class AE3Context(SuperContext):
         super().__init__(address, password)
 
         # Initialize Variables
-        Utils.init_logging(APConsole.Info.client_name.value + self.client_version)
+        if not AE3Context.is_logging_initialized:
+            Utils.init_logging(APConsole.Info.client_name.value + self.client_version)
+            AE3Context.is_logging_initialized = True
 
         self.ipc = AEPS2Interface(logger)
 
+        ## Anything mutable is created per instance, so that sessions in the same process do not share state
+        self.active_locations = set()
+        self.consolation_pool = LocationPool()
+        self.cache_missing = []
+        self.pre_hinted = {}
+        self.hint_cache = AE3HintCache(-1, {})
+        self.hint_caches = {}
+        self.goal_target = GoalTarget()
+        self.progress = ProgressTracker()
+        self.progress.subscribe("goal", self.goal)
+        self.progress.subscribe("pgc", self.on_pgc_passed)
+        self.consolation_whitelist = [
+            APHelper.nothing.value,
+            APHelper.hint_filler.value,
+            APHelper.hint_progressive.value,
+            APHelper.check_filler.value,
+            APHelper.check_progressive.value,
+            APHelper.check_pgc.value,
+            APHelper.check_gt.value,
+        ]
+        self.monkeys_index = []
+
         self.cached_locations_checked = set()
+        self.items_received_counts = Counter()
+        self.applied_morph_durations = {}
+        self.outbound_locations = set()
+        self.outbound_hints = {}
+        self.outbound_sets = {}
+        self.offline_journal = AE3OfflineJournal(logger)
+        self.offline_journal.load()
         for lists in [*MONKEYS_DIRECTORY.values()]:
             if lists not in self.monkeys_index:
                 self.monkeys_index.append(lists)
@@ -687,13 +785,8 @@ class AE3Context(SuperContext):
                 excluded_stages = [*STAGES_BREAK_ROOMS]
 
             ### Exclude Blacklisted Channels from Goal Target and Post Game Condition
-            if self.progression.progression[-1]:
-                for channel in self.progression.order[-self.progression.progression[-1]:]:
-                    excluded_locations.extend(MONKEYS_MASTER_ORDERED[channel])
-                    excluded_locations.append(CAMERAS_MASTER_ORDERED[channel])
-
-                    excluded_phones_id: list[str] = CELLPHONES_MASTER_ORDERED[channel]
-                    excluded_locations.extend(Cellphone_Name_to_ID[cell_id] for cell_id in excluded_phones_id)
+            blacklisted_locations, post_game_locations = self.progression.get_excluded_locations()
+            excluded_locations.extend(blacklisted_locations)
 
             goal_amount : int = 0
             if APHelper.goal_target_ovr.value in data:
@@ -729,20 +822,14 @@ class AE3Context(SuperContext):
                 amounts[APHelper.keys.value] = data[APHelper.pgc_keys.value]
 
             # Exclude Channels in Post Game from being required for Post Game to be unlocked
-            post_game_start_index = sum(self.progression.progression[:-2]) + 1
-            for channel in (self.progression.order[post_game_start_index:
-                post_game_start_index + self.progression.progression[-2]]):
-                    excluded_locations.extend(MONKEYS_MASTER_ORDERED[channel])
-                    excluded_locations.append(CAMERAS_MASTER_ORDERED[channel])
-
-                    excluded_phones_id: list[str] = CELLPHONES_MASTER_ORDERED[channel]
-                    excluded_locations.extend(Cellphone_Name_to_ID[cell_id] for cell_id in excluded_phones_id)
+            excluded_locations.extend(post_game_locations)
 
             # Exclude Ultim-ape Fighter from being a PGC requirement, as it requires as many monkeys as possible
             excluded_locations.extend(SHOP_PROGRESSION_75COMPLETION)
 
             ## Post Game Access Rule Initialization
             self.post_game_condition = PostGameCondition(amounts, excluded_stages, excluded_locations)
+            self.progress.reset()
 
             ## Shuffle Channel
             if APHelper.shuffle_channel.value in data:
@@ -814,16 +901,36 @@ class AE3Context(SuperContext):
             if APHelper.hints.value in data:
                 self.pre_hinted = {int(key) : value for key, value in data[APHelper.hints.value].items()}
 
+            ## Scout all hint targets of this slot at once, keeping what is known of them for as long as the client runs
+            self.hint_cache = self.hint_caches.setdefault((self.seed_name, self.team, self.slot),
+                                                          AE3HintCache(self.slot, self.pre_hinted))
+            scout_targets : set[int] = self.hint_cache.get_scout_targets()
+            if scout_targets:
+                Utils.async_start(self.send_msgs([{
+                    "cmd": "LocationScouts",
+                    "locations": sorted(scout_targets),
+                    "create_as_hint": 0
+                }]))
+
             # Initiate Checked Locations Cache Rebuilding if necessary:
             if not self.locations_checked and not self.cache_missing:
                 self.is_cache_built = False
                 self.cache_missing = self.location_groups.copy()
 
+            # Restore local session cache for this slot
+            self.restore_session_cache()
+
+            # Drop offline checks the server already knows of, and allow the rest to be sent again
+            self.last_slot_key = (self.seed_name, self.team, self.slot)
+            self.offline_journal.reset_sent()
+            self.offline_journal.acknowledge(self.checked_locations, self.last_slot_key)
+
             # Initialize/Update Last Save Type Status on server if needed
             if self.load_state_on_connect:
                 self.pending_last_save_status = True
 
             # Create List of Active Locations
+            self.active_locations = set(self.locations_name_to_id.keys()).difference(MONKEYS_PASSWORDS)
             if not self.check_break_rooms:
                 self.active_locations.difference_update(MONKEYS_BREAK_ROOMS)
 
@@ -834,6 +941,12 @@ class AE3Context(SuperContext):
                     self.active_locations.difference_update(
                         set(SHOP_COLLECTION_MASTER).difference(SHOP_PERSISTENT_MASTER))
 
+            # Only unchecked Active Locations can be picked by consolation prizes
+            checked : Set[int] = self.checked_locations | self.locations_checked
+            self.consolation_pool = LocationPool({self.locations_name_to_id[location] : location
+                                                  for location in self.active_locations
+                                                  if self.locations_name_to_id[location] not in checked})
+
             # When connection details from options are different from defaults,
             # reconnect to the emulator with the new details
             if is_pine_slot_changed or is_pine_platform_changed:
@@ -863,6 +976,13 @@ class AE3Context(SuperContext):
         elif cmd == APHelper.cmd_rcv.value:
             index = args["index"]
 
+            # Keep tally of received Items up to date
+            if not index:
+                self.items_received_counts.clear()
+                self.items_received_counted = 0
+
+            self.update_items_received_counts()
+
             # Update Next Item Slot
             if index:
                 self.next_item_slot = index
@@ -879,12 +999,12 @@ class AE3Context(SuperContext):
             if self.character < 0 and self.current_stage:
                 self.character = self.ipc.get_character()
 
-            received_as_id : list[int] = [ i.item for i in self.items_received]
+            received : Counter[int] = self.items_received_counts
 
             # Rebuild Progress
             ## Get Keys
             if self.unlocked_channels <= 0:
-                self.keys = received_as_id.count(self.items_name_to_id[APHelper.channel_key.value])
+                self.keys = received[self.items_name_to_id[APHelper.channel_key.value]]
                 self.unlocked_channels = self.progression.get_progress(self.keys, self.post_game_condition.check(self))
                 self.ipc.set_unlocked_stages(self.unlocked_channels)
 
@@ -897,32 +1017,32 @@ class AE3Context(SuperContext):
 
             ## Get Shop Stock
             if self.shoppingsanity == 4 and 0 >= self.shop_progress >= 27:
-                self.shop_progress =( (received_as_id.count(self.items_name_to_id[APHelper.shop_stock.value]) + 1) *
+                self.shop_progress =( (received[self.items_name_to_id[APHelper.shop_stock.value]] + 1) *
                                       self.shop_progression - 1 )
 
             # Check if dummy morph is needed
-            self.dummy_morph_monkey_needed = self.items_name_to_id[Itm.morph_monkey.value] not in received_as_id
+            self.dummy_morph_monkey_needed = not received[self.items_name_to_id[Itm.morph_monkey.value]]
 
             if self.dummy_morph == Itm.morph_monkey.value:
                 self.dummy_morph_needed = self.dummy_morph_monkey_needed
             else:
                 morph_ids : list[int] = [ self.items_name_to_id[morph] for morph in Itm.get_morphs_ordered() ]
-                self.dummy_morph_needed = not any(item in morph_ids for item in received_as_id)
+                self.dummy_morph_needed = not any(received[morph] for morph in morph_ids)
 
             # Retrace Morph Duration
             if self.morph_duration != 0:
-                self.morph_duration += received_as_id.count(self.items_name_to_id[Itm.acc_morph_ext.value]) * 2
+                self.morph_duration += received[self.items_name_to_id[Itm.acc_morph_ext.value]] * 2
                 dummy : str = self.dummy_morph if self.dummy_morph_needed else ""
                 self.ipc.set_morph_duration(self.character, self.morph_duration, dummy)
 
             # Check RC Car Unlock
             for rcc in Itm.get_chassis_by_id():
-                if self.items_name_to_id[rcc] in received_as_id:
+                if received[self.items_name_to_id[rcc]]:
                     self.rcc_unlocked = True
                     break
 
             # Check Water Net Unlock
-            self.swim_unlocked = self.items_name_to_id[Itm.gadget_swim.value] in received_as_id
+            self.swim_unlocked = received[self.items_name_to_id[Itm.gadget_swim.value]] > 0
 
             self.are_item_status_synced = True
 
@@ -935,6 +1055,16 @@ class AE3Context(SuperContext):
                 else:
                     self.is_last_save_normal = bool(self.stored_data[last_save_string])
 
+        # Acknowledge offline checks that have been received by the server
+        elif cmd == APHelper.cmd_rmupdt.value:
+            if "checked_locations" in args:
+                self.offline_journal.acknowledge(set(args["checked_locations"]), self.last_slot_key)
+                self.consolation_pool.discard(args["checked_locations"])
+
+        # Keep scouted hint targets
+        elif cmd == APHelper.cmd_locinfo.value:
+            self.hint_cache.store(NetworkItem(*item) for item in args["locations"])
+
         # Initialize Session on receive of RoomInfo Packet
         elif cmd == APHelper.cmd_rminfo.value:
             seed: str = args[APHelper.arg_seed.value]
@@ -943,6 +1073,7 @@ class AE3Context(SuperContext):
             if self.seed_name != seed:
                 self.checked_locations.clear()
                 self.locations_checked.clear()
+                self.progress.touch()
 
                 self.seed_name = seed
 
@@ -962,19 +1093,153 @@ class AE3Context(SuperContext):
 
         return ui
 
+    def update_items_received_counts(self):
+        """Tally any newly received Items, so lookups on the amount received of an Item do not rescan the list."""
+        # Start over if the list of received Items has been replaced by a shorter one
+        if self.items_received_counted > len(self.items_received):
+            self.items_received_counts.clear()
+            self.items_received_counted = 0
+
+        self.items_received_counts.update(item.item for item in self.items_received[self.items_received_counted:])
+        self.items_received_counted = len(self.items_received)
+
+    def restore_session_cache(self):
+        """Load the local cache of this slot, skipping emulator sweeps and recounts already done in a past session."""
+        self.session_cache = AE3SessionCache(logger, self.seed_name, self.team, self.slot,
+                                             self.locations_name_to_id.values())
+        if not self.session_cache.load():
+            return
+
+        cache : AE3SessionCache = self.session_cache
+
+        # Only sweep groups with Locations that were not yet known to be checked
+        self.cache_missing = [group for group in self.cache_missing
+                              if not all(self.locations_name_to_id.get(location) in cache.checked
+                                         for location in group)]
+
+        if cache.pgc:
+            self.post_game_condition.passed = True
+
+        if cache.keys and self.keys < cache.keys:
+            self.keys = cache.keys
+            self.unlocked_channels = self.progression.get_progress(self.keys, cache.pgc)
+
+        if cache.shop_progress >= 0 and self.shoppingsanity >= 3:
+            self.shop_progress = cache.shop_progress
+
+    def update_session_cache(self):
+        if self.session_cache is None:
+            return
+
+        self.session_cache.update(self.checked_locations | self.locations_checked, self.last_item_processed_index,
+                                  self.keys, self.shop_progress, self.post_game_condition.passed)
+        self.session_cache.save()
+
+    # Outbound Message Coalescing
+    def queue_location_checks(self, locations : Iterable[int]):
+        locations = set(locations)
+        self.outbound_locations.update(locations)
+        self.consolation_pool.discard(locations)
+        self.schedule_outbound_flush()
+
+    def queue_hints(self, player : int, locations : Iterable[int]):
+        # Skip Locations that were already hinted, or have already been found in this slot
+        locations = self.hint_cache.claim(player, locations)
+        if player == self.slot:
+            locations.difference_update(self.checked_locations)
+
+        if not locations:
+            return
+
+        self.outbound_hints.setdefault(player, set()).update(locations)
+        self.schedule_outbound_flush()
+
+    def show_scouted_hint(self, location_id : int):
+        """Show the contents of a scouted Location right away, without waiting on the server to relay the hint."""
+        item : Optional[NetworkItem] = self.hint_cache.get(location_id)
+        if item is None:
+            return
+
+        logger.info(APConsole.Info.hint_book.value.format(
+            item=self.item_names.lookup_in_slot(item.item, item.player),
+            player=self.player_names.get(item.player, item.player),
+            location=self.location_names.lookup_in_slot(location_id, self.slot)))
+
+    def queue_set(self, key : str, default, operations : list[dict]):
+        # A replace makes any earlier operations on the same key irrelevant
+        if key not in self.outbound_sets or operations[0]["operation"] == "replace":
+            self.outbound_sets[key] = {"cmd": "Set", "key": key, "default": default, "operations": [*operations]}
+        else:
+            self.outbound_sets[key]["operations"].extend(operations)
+
+        self.schedule_outbound_flush()
+
+    def schedule_outbound_flush(self):
+        if self.outbound_flush_task is None or self.outbound_flush_task.done():
+            self.outbound_flush_task = asyncio.create_task(self.flush_outbound_later(), name="Outbound Flush")
+
+    async def flush_outbound_later(self):
+        await asyncio.sleep(self.outbound_window)
+        await self.flush_outbound()
+
+    async def flush_outbound(self):
+        """Send all held messages as one frame, with Locations merged and deduplicated per command."""
+        if not (self.outbound_locations or self.outbound_hints or self.outbound_sets):
+            return
+
+        locations : Set[int] = self.outbound_locations.difference(self.checked_locations)
+        hints : dict[int, Set[int]] = self.outbound_hints
+        sets : dict[str, dict] = self.outbound_sets
+
+        self.outbound_locations = set()
+        self.outbound_hints = {}
+        self.outbound_sets = {}
+
+        # Keep checks made while the connection dropped, in the same way as those made offline
+        if not self.server:
+            if locations:
+                self.offline_journal.record(locations, self.last_slot_key)
+            for player, hinted in hints.items():
+                self.hint_cache.release(player, hinted)
+            return
+
+        msgs : list[dict] = []
+        if locations:
+            msgs.append({"cmd": "LocationChecks", "locations": sorted(locations)})
+
+        for player, hinted in hints.items():
+            msgs.append({"cmd": "CreateHints", "locations": sorted(hinted), "player": player})
+
+        msgs.extend(sets.values())
+
+        if msgs:
+            await self.send_msgs(msgs)
+
+    async def wait_for_next_tick(self):
+        """Sleep for what remains of the tick interval, so that the Checker runs at most at the configured rate."""
+        loop : asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        await asyncio.sleep(max(self.tick_interval - (loop.time() - self.last_tick), 0.0))
+        self.last_tick = loop.time()
+
     async def check_pgc(self) -> bool:
-        if self.post_game_condition.passed:
-            return True
-        if self.post_game_condition.check(self):
-            self.ipc.set_pgc_cache()
-            return True
+        await self.progress.update(self)
+        return self.progress.pgc_passed
 
-        return False
+    async def on_pgc_passed(self):
+        self.ipc.set_pgc_cache()
+
+        new_unlocked : int = self.progression.get_progress(self.keys, True)
+        if self.unlocked_channels < new_unlocked:
+            self.unlocked_channels = new_unlocked
+            self.ipc.set_unlocked_stages(self.unlocked_channels)
 
     async def goal(self):
         if self.game_goaled:
             return
 
+        # Make sure any held Location checks reach the server before the goal does
+        await self.flush_outbound()
         await self.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
         self.game_goaled = True
 
@@ -994,11 +1259,12 @@ def update_connection_status(ctx : AE3Context, status : bool):
 # Main Client Loop
 async def main_sync_task(ctx : AE3Context):
     # Greetings
-    logger.info(APConsole.Info.decor.value)
-    logger.info("    " + APConsole.Info.greet.value)
-    logger.info("    World v" + APConsole.Info.world_ver.value + "    Client v" + APConsole.Info.client_ver.value)
-    logger.info(APConsole.Info.decor.value)
-    logger.info("\n")
+    if not ctx.headless:
+        logger.info(APConsole.Info.decor.value)
+        logger.info("    " + APConsole.Info.greet.value)
+        logger.info("    World v" + APConsole.Info.world_ver.value + "    Client v" + APConsole.Info.client_ver.value)
+        logger.info(APConsole.Info.decor.value)
+        logger.info("\n")
 
     if ctx.pine_connect_offline:
         logger.info(APConsole.Info.p_init.value)
@@ -1035,6 +1301,28 @@ async def main_sync_task(ctx : AE3Context):
             await asyncio.sleep(3)
             continue
 
+# DeathLink Watcher
+## Polls for deaths at a higher rate than the main loop, but only while DeathLink is enabled
+async def deathlink_watch_task(ctx : AE3Context):
+    while not ctx.exit_event.is_set():
+        if not (ctx.death_link and ctx.is_game_connected and ctx.server and ctx.slot and ctx.player_control):
+            await asyncio.sleep(0.5)
+            continue
+
+        try:
+            if not ctx.command_state:
+                await check_deathlink(ctx)
+        except ConnectionError:
+            # Reconnection is left to the main loop
+            await asyncio.sleep(3)
+            continue
+        except Exception:
+            logger.error(traceback.format_exc())
+            await asyncio.sleep(3)
+            continue
+
+        await asyncio.sleep(ctx.deathlink_watch_interval)
+
 async def check_game(ctx : AE3Context):
     if ctx.server:
         if ctx.pending_last_save_status:
@@ -1083,16 +1371,19 @@ async def check_game(ctx : AE3Context):
             ctx.last_item_processed_index = ctx.ipc.get_last_item_index()
 
         # If there are offline locations to send, do so
-        if ctx.offline_locations_checked:
+        if ctx.offline_journal:
             await update_offline_checked(ctx)
 
         # Get Character
         if ctx.character < 0:
             ctx.character = ctx.ipc.get_character()
 
-        # Get Cached PGC Status on connect
+        # Get Cached PGC Status on connect, restoring it in game if the local session cache knows it was passed
         if ctx.has_just_connected:
-            ctx.post_game_condition.passed = ctx.ipc.check_pgc_cache()
+            if ctx.post_game_condition.passed and not ctx.ipc.check_pgc_cache():
+                ctx.ipc.set_pgc_cache()
+
+            ctx.post_game_condition.passed = ctx.post_game_condition.passed or ctx.ipc.check_pgc_cache()
 
         # Setup Stage when needed and double check locations
         if ctx.in_travel_station:
@@ -1102,6 +1393,7 @@ async def check_game(ctx : AE3Context):
 
                 if ctx.current_channel == APHelper.shopping_area.value:
                     ctx.in_shopping_area = True
+                    ctx.shop_state = ShopState.ENTERING
                     await set_persistent_values(ctx)
         elif ctx.in_shopping_area:
             if ctx.current_channel != APHelper.shopping_area.value:
@@ -1110,11 +1402,16 @@ async def check_game(ctx : AE3Context):
                 if ctx.current_channel == APHelper.travel_station.value:
                     await reapply_persistent_values(ctx)
                     ctx.in_travel_station = True
+                    ctx.level_select_key = None
+
+                ctx.shop_state = ShopState.NONE
         else:
             if ctx.current_channel == APHelper.travel_station.value:
                 ctx.in_travel_station = True
+                ctx.level_select_key = None
             elif ctx.current_channel == APHelper.shopping_area.value:
                 ctx.in_shopping_area = True
+                ctx.shop_state = ShopState.ENTERING
                 ctx.is_using_data_desk = False
                 await rebuild_persistent_values(ctx)
             else:
@@ -1165,8 +1462,14 @@ async def check_game(ctx : AE3Context):
                 ctx.is_last_save_normal = False
                 await set_last_save_status(ctx)
 
+        # Send any messages held during this tick
+        await ctx.flush_outbound()
+
+        # Keep local session cache up to date
+        ctx.update_session_cache()
+
         # Sleep functions keep the client from being unresponsive
-        await asyncio.sleep(0.5)
+        await ctx.wait_for_next_tick()
 
     else:
         message : str = APConsole.Info.p_init_sre.value
@@ -1242,36 +1545,82 @@ def assert_version_compatibility(subject: str, base: str):
                              f"version that this client is not compatible with. Connection Aborted."
                              f"\nWorld version: {subject}\nClient version: {base}")
 
+# Client Sessions
+class AE3Session:
+    """
+    A single connection to an Archipelago slot and the emulator playing it, along with the tasks polling them.
+    Sessions only share the immutable tables of AE3Context, so several of them can be run in the same process.
+    """
+    ctx : AE3Context
+
+    def __init__(self, address : Optional[str], password : Optional[str], name : str = "",
+                 pine_slot : Optional[int] = None):
+        self.ctx = AE3Context(address, password)
+        self.ctx.auth = name
+
+        if pine_slot is not None:
+            self.ctx.pine_slot = pine_slot
+            self.ctx.ipc.set_slot(pine_slot)
+
+    def start(self):
+        ctx : AE3Context = self.ctx
+
+        # Archipelago Server Connections
+        logger.info(APConsole.Info.p_init_s.value)
+        ctx.server_task = asyncio.create_task(server_loop(ctx), name="Server Loop")
+
+        # Emulator Polling
+        ctx.interface_sync_task = asyncio.create_task(main_sync_task(ctx), name="PCSX2 Sync")
+        ctx.deathlink_watch_task = asyncio.create_task(deathlink_watch_task(ctx), name="DeathLink Watcher")
+
+    async def wait(self):
+        ctx : AE3Context = self.ctx
+
+        await ctx.exit_event.wait()
+        ctx.server_address = None
+
+        await ctx.shutdown()
+
+        # Call Main Client Loop
+        if ctx.interface_sync_task:
+            await asyncio.sleep(3)
+            await ctx.interface_sync_task
+        if ctx.deathlink_watch_task:
+            await ctx.deathlink_watch_task
+
+async def run_sessions(sessions : Sequence[AE3Session]):
+    """Run several sessions side by side without any interface, until all of them have exited."""
+    for session in sessions:
+        session.start()
+
+    await asyncio.gather(*(session.wait() for session in sessions))
+
 # Starting point of function
 async def main(args: Namespace):
     multiprocessing.freeze_support()
 
-    # Create Game Context
-    ctx = AE3Context(args.connect, args.password)
-    ctx.auth = args.name
-
-    # Archipelago Server Connections
-    logger.info(APConsole.Info.p_init_s.value)
-    ctx.server_task = asyncio.create_task(server_loop(ctx), name="Server Loop")
+    # Create Game Session
+    session : AE3Session = AE3Session(args.connect, args.password, args.name)
+    ctx : AE3Context = session.ctx
 
-    if tracker_loaded:
-        ctx.run_generator()
-    if gui_enabled:
-        ctx.run_gui()
-    ctx.run_cli()
+    ctx.headless = args.headless
+    ctx.tick_interval = 1 / args.checker_rate if args.checker_rate > 0 else 0.0
 
-    # Create Main Loop
-    ctx.interface_sync_task = asyncio.create_task(main_sync_task(ctx), name="PCSX2 Sync")
+    # Headless Mode replaces the formatted console output with structured logs, and runs without any interface
+    if ctx.headless:
+        for handler in logging.getLogger().handlers:
+            handler.setFormatter(JSONLogFormatter())
 
-    await ctx.exit_event.wait()
-    ctx.server_address = None
+    session.start()
 
-    await ctx.shutdown()
+    if not ctx.headless:
+        if tracker_loaded:
+            ctx.run_generator()
+        if gui_enabled:
+            ctx.run_gui()
+        ctx.run_cli()
 
-    # Call Main Client Loop
-    if ctx.interface_sync_task:
-        await asyncio.sleep(3)
-        await ctx.interface_sync_task
+    await session.wait()
 
 def launch(*args: str):
     launch_init(*args)
@@ -1287,6 +1636,10 @@ def launch_init(*args: Sequence[str]) -> None:
     parser.add_argument("--name", default="", type=str, nargs="?", help="Slot Name to connect as")
     parser.add_argument("url", default="", type=str, nargs="?",
                         help="URL of Archipelago Room to connect to")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run without the GUI, tracker or console, writing logs as JSON lines")
+    parser.add_argument("--checker-rate", default=2.0, type=float,
+                        help="Maximum amount of times per second the game is checked. 0 removes the limit")
     launch_args: Namespace = handle_url_arg(parser.parse_args(args))
 
     colorama.init()
@@ -0,0 +1,122 @@
+from typing import Collection, Iterable, Mapping, Optional
+from functools import lru_cache
+import random
+
+from .data.Strings import APHelper
+from .data.Distribution import CONSOLATION_RATES
+
+
+### [< --- PRIZE SAMPLER --- >]
+class AliasTable:
+    """
+    Weighted sampler built once with Vose's Alias Method, so that each draw afterward only takes a single index and
+    a single comparison regardless of the number of outcomes.
+    """
+    outcomes : tuple[str, ...]
+    probabilities : tuple[float, ...]
+    aliases : tuple[int, ...]
+
+    def __init__(self, weights : Mapping[str, float]):
+        self.outcomes = tuple(weights.keys())
+
+        count : int = len(self.outcomes)
+        total : float = sum(weights.values())
+        scaled : list[float] = [weight * count / total for weight in weights.values()]
+
+        probabilities : list[float] = [1.0] * count
+        aliases : list[int] = [*range(count)]
+
+        small : list[int] = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large : list[int] = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+
+        while small and large:
+            less : int = small.pop()
+            more : int = large.pop()
+
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Anything left over only strays from 1 by floating point error, and always picks itself
+
+        self.probabilities = tuple(probabilities)
+        self.aliases = tuple(aliases)
+
+    def draw(self) -> str:
+        index : int = random.randrange(len(self.outcomes))
+        if random.random() >= self.probabilities[index]:
+            index = self.aliases[index]
+
+        return self.outcomes[index]
+
+@lru_cache(maxsize=None)
+def get_prize_table(rate_type : int, whitelist : frozenset[str]) -> AliasTable:
+    """Get the sampler for the given rates, where the chances of any prize not whitelisted go to Nothing instead."""
+    rates : dict[str, float] = {}
+    for prize, rate in CONSOLATION_RATES[rate_type].items():
+        if prize not in whitelist:
+            prize = APHelper.nothing.value
+
+        rates[prize] = rates.get(prize, 0.0) + rate
+
+    return AliasTable(rates)
+
+
+### [< --- LOCATION POOL --- >]
+class LocationPool:
+    """
+    Unchecked Locations available to be picked by consolation prizes. Locations are held in a list with their index
+    tracked alongside, so that both drawing and removing one can be done without rebuilding the list.
+    """
+    # Number of tries at drawing a Location that is not excluded before checking the whole pool instead
+    max_attempts : int = 16
+
+    ids : list[int]
+    index : dict[int, int]
+    names : dict[int, str]
+
+    def __init__(self, names : Optional[Mapping[int, str]] = None):
+        self.names = dict(names) if names else {}
+        self.ids = [*self.names.keys()]
+        self.index = {location_id : i for i, location_id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, location_id : int) -> bool:
+        return location_id in self.index
+
+    def discard(self, locations : Iterable[int]):
+        """Remove Locations from the pool by swapping the last entry into their place."""
+        for location_id in locations:
+            i : Optional[int] = self.index.pop(location_id, None)
+            if i is None:
+                continue
+
+            last : int = self.ids.pop()
+            if last != location_id:
+                self.ids[i] = last
+                self.index[last] = i
+
+    def draw(self, excluded : Collection[str] = ()) -> str:
+        """Pick a random Location in the pool that is not excluded. Returns an empty string if there are none."""
+        if not self.ids:
+            return ""
+
+        for _ in range(self.max_attempts):
+            name : str = self.names[random.choice(self.ids)]
+            if name not in excluded:
+                return name
+
+        # Fall back to filtering the pool when most of it is excluded
+        candidates : list[str] = [self.names[location_id] for location_id in self.ids
+                                  if self.names[location_id] not in excluded]
+        if not candidates:
+            return ""
+
+        return random.choice(candidates)
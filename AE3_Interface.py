@@ -1,10 +1,11 @@
-from typing import Optional, Sequence
+from typing import NamedTuple, Optional, Sequence
 from logging import Logger
 from enum import Enum
 from math import ceil
+import struct
 
 from .data.Addresses import VersionAddresses, get_version_addresses
-from .data.Items import HUD_OFFSETS
+from .data.Items import HUD_OFFSETS, Capacities
 from .data.Locations import CELLPHONES_ID_DUPLICATES, CELLPHONES_STAGE_DUPLICATES, LOCATIONS_ALTERNATIVE
 from .data.Stages import LEVELS_ID_BY_ORDER
 from .data.Strings import Itm, Loc, Meta, Game, APHelper, APConsole
@@ -22,9 +23,17 @@ class ConnectionStatus(Enum):
         return self.value > 0
 
 
+class LevelSelectState(NamedTuple):
+    on_warp_gate : bool
+    level_confirmed : bool
+    unlocked_channels : int
+    selected_channel : int
+    gui_status : int
+
+
 ### [< --- INTERFACE --- >]
 class AEPS2Interface:
-    pine : Pine = Pine()
+    pine : Pine
     status : ConnectionStatus = ConnectionStatus.DISCONNECTED
 
     loaded_game : Optional[str] = None
@@ -132,6 +141,14 @@ class AEPS2Interface:
 
         return 0x0
 
+    def read_int_batch(self, requests : Sequence[tuple[int, int]]) -> list[int]:
+        """Read several integers in a single IPC exchange. Requests are pairs of address and size in bytes."""
+        commands : dict[int, Pine.IPCCommand] = {1: Pine.IPCCommand.READ8, 2: Pine.IPCCommand.READ16,
+                                                 4: Pine.IPCCommand.READ32, 8: Pine.IPCCommand.READ64}
+
+        values : list[bytes] = self.pine.batch_read([(commands[size], address) for address, size in requests])
+        return [Pine.from_bytes(value) for value in values]
+
     # { Game Check }
     def get_progress(self) -> str:
         addr : int = self.addresses.GameStates[Game.progress.value]
@@ -215,6 +232,19 @@ class AEPS2Interface:
         value: int = self.pine.read_int8(self.addresses.GameStates[Game.channel_confirmed.value])
         return value != 0
 
+    def get_level_select_state(self) -> LevelSelectState:
+        """Get the states relevant to the Level Select in the Travel Station in a single IPC exchange."""
+        on_warp_gate, level_confirmed, unlocked_channels, selected_channel, gui_status = self.read_int_batch([
+            (self.addresses.GameStates[Game.on_warp_gate.value], 1),
+            (self.addresses.GameStates[Game.channel_confirmed.value], 1),
+            (self.addresses.GameStates[Game.channels_unlocked.value], 4),
+            (self.addresses.GameStates[Game.channel_selected.value], 4),
+            (self.addresses.GameStates[Game.gui_status.value], 1)
+        ])
+
+        return LevelSelectState(on_warp_gate != 0, level_confirmed != 0, unlocked_channels, selected_channel,
+                                gui_status)
+
     def get_character(self) -> int:
         return self.pine.read_int32(self.addresses.GameStates[Game.character.value])
 
@@ -224,6 +254,15 @@ class AEPS2Interface:
     def get_cookies(self) -> float:
         return self.pine.read_float(self.addresses.GameStates[Game.cookies.value])
 
+    def get_deathlink_state(self) -> tuple[float, int]:
+        """Get the amount of cookies and the GUI status of the player in a single IPC exchange."""
+        cookies, gui_status = self.pine.batch_read([
+            (Pine.IPCCommand.READ32, self.addresses.GameStates[Game.cookies.value]),
+            (Pine.IPCCommand.READ8, self.addresses.GameStates[Game.gui_status.value])
+        ])
+
+        return struct.unpack("<f", cookies)[0], Pine.from_bytes(gui_status)
+
     def get_morph_gauge_recharge_value(self) -> float:
         return self.pine.read_float(self.addresses.GameStates[Game.morph_gauge_recharge.value])
 
@@ -243,12 +282,39 @@ class AEPS2Interface:
 
         return self.pine.read_int32(self.addresses.Items[address_name]) == 0x2 and is_variant_unlocked
 
+    def get_equipment_unlocked(self, address_names : Sequence[str]) -> dict[str, bool]:
+        """Batched equivalent of is_equipment_unlocked for several equipment at once."""
+        chassis : Sequence[str] = Itm.get_chassis_by_id()
+
+        requests : list[tuple[int, int]] = [(self.addresses.Items[Itm.gadget_rcc.value], 4)]
+        requests.extend((self.addresses.Items[name], 1 if "Chassis" in name else 4) for name in address_names)
+
+        values : list[int] = self.read_int_batch(requests)
+        is_rcc_unlocked : bool = values[0] == 0x2
+
+        unlocked : dict[str, bool] = {}
+        for name, value in zip(address_names, values[1:]):
+            # Chassis are only considered unlocked alongside the RC Car itself
+            if "Chassis" in name:
+                unlocked[name] = is_rcc_unlocked and name in chassis and value == 0x1
+            else:
+                unlocked[name] = value == 0x2
+
+        return unlocked
+
     def is_chassis_unlocked(self, chassis_name : str) -> bool:
         if chassis_name not in Itm.get_chassis_by_id():
             return False
 
         return self.pine.read_int8(self.addresses.Items[chassis_name]) == 0x1
 
+    def get_chassis_unlocked(self) -> list[bool]:
+        """Batched equivalent of is_chassis_unlocked for all chassis, in order."""
+        chassis : Sequence[str] = Itm.get_chassis_by_id(no_default=True)
+        values : list[int] = self.read_int_batch([(self.addresses.Items[name], 1) for name in chassis])
+
+        return [value == 0x1 for value in values]
+
     def is_real_chassis_unlocked(self, chassis_name : str) -> bool:
         if chassis_name not in Itm.get_real_chassis_by_id():
             return False
@@ -258,8 +324,12 @@ class AEPS2Interface:
     def get_current_morph(self):
         return self.pine.read_int8(self.addresses.GameStates[Game.current_morph.value])
 
-    def get_morph_duration(self, character : int = 0) -> float:
-        return self.pine.read_int32(self.addresses.get_morph_duration_addresses(character)[0])
+    def get_morph_durations(self, character : int = 0) -> tuple[float, ...]:
+        """Get the durations of all Morphs of the character in a single IPC exchange."""
+        values : list[bytes] = self.pine.batch_read([(Pine.IPCCommand.READ32, address) for address in
+                                                     self.addresses.get_morph_duration_addresses(character)])
+
+        return tuple(struct.unpack("<f", value)[0] for value in values)
 
     def get_player_state(self) -> int:
         return self.pine.read_int32(self.addresses.GameStates[Game.state.value])
@@ -592,6 +662,19 @@ class AEPS2Interface:
         if chassis:
             self.pine.write_int8(self.addresses.Items[chassis], 0x0)
 
+    def set_chassis_direct_states(self, unlocked : Sequence[bool]):
+        """Lock or unlock each real chassis in order, only writing to those that differ from the game."""
+        addresses : list[int] = [self.addresses.Items[chassis] for chassis in Itm.get_real_chassis_by_id()]
+        current : list[int] = self.read_int_batch([(address, 1) for address in addresses])
+
+        requests : list[tuple[Pine.IPCCommand, int, bytes]] = [
+            (Pine.IPCCommand.WRITE8, address, Pine.to_bytes(int(state), 1))
+            for address, value, state in zip(addresses, current, unlocked) if value != int(state)
+        ]
+
+        if requests:
+            self.pine.batch_write(requests)
+
     def set_chassis_direct(self, chassis_idx : int):
         self.pine.write_int32(self.addresses.GameStates[Game.equip_chassis_active.value], chassis_idx)
 
@@ -626,6 +709,15 @@ class AEPS2Interface:
     def set_pgc_cache(self):
         self.pine.write_int8(self.addresses.GameStates[Game.pgc_cache.value], 0x1)
 
+    @staticmethod
+    def get_morph_duration_targets(duration : float, dummy : str = "") -> tuple[float, ...]:
+        """Get the durations to be set for each Morph, as they would be read back from the game."""
+        dummy_index : int = Itm.get_morphs_ordered().index(dummy) if dummy else - 1
+
+        # Set duration to 0 if not specified in morphs and exclusive is false
+        as_float : float = struct.unpack("<f", struct.pack("<f", duration))[0]
+        return tuple(0.0 if idx == dummy_index else as_float for idx in range(len(Itm.get_morphs_ordered())))
+
     def set_morph_duration(self, character : int, duration : float, dummy : str = ""):
         if character < 0:
             return
@@ -634,21 +726,16 @@ class AEPS2Interface:
         if not durations:
             return
 
-        dummy_index : int = Itm.get_morphs_ordered().index(dummy) if dummy else - 1
-
-        for idx, morph in enumerate(durations):
-            duration_to_set : float = duration
-            # Set duration to 0 if not specified in morphs and exclusive is false
-            if dummy and idx == dummy_index:
-                duration_to_set = 0.0
-
-            self.pine.write_float(morph, duration_to_set)
+        targets : tuple[float, ...] = self.get_morph_duration_targets(duration, dummy)
+        self.pine.batch_write([(Pine.IPCCommand.WRITE32, morph, struct.pack("<f", target))
+                               for morph, target in zip(durations, targets)])
 
     def set_morph_stock(self, stocks : int):
         self.pine.write_float(self.addresses.GameStates[Game.morph_stocks.value],stocks * 100)
 
     def give_collectable(self, address_name : str, amount : int | float = 0x1, maximum : int | float = 0x0,
-                         is_in_shop : bool = False, stocks_shuffled: bool = False, monkey_mart:bool = True):
+                         is_in_shop : bool = False, stocks_shuffled: bool = False, monkey_mart:bool = True,
+                         count : int = 1, refresh_hud : bool = True) -> Optional[int]:
         address : int = self.addresses.GameStates[address_name]
 
         use_main: bool = True
@@ -656,7 +743,7 @@ class AEPS2Interface:
             use_main = False
             if stocks_shuffled and address_name == Game.morph_stocks.value:
                 current = self.get_persistent_morph_stock_value()
-                self.set_persistent_morph_stock_value(current + 1)
+                self.set_persistent_morph_stock_value(current + count)
             elif address_name == Game.cookies.value:
                 if not monkey_mart:
                     current = self.get_persistent_cookie_value()
@@ -664,42 +751,72 @@ class AEPS2Interface:
                 else:
                     use_main = True
 
-        if use_main:
-            value: int = 0
+        if not use_main:
+            return None
 
-            if isinstance(amount, int):
-                current: int = self.pine.read_int32(address)
+        value: int = 0
 
-                value = min(current + amount, maximum)
-                self.pine.write_int32(address, value)
-            elif isinstance(amount, float):
-                current: float = self.pine.read_float(address)
+        if isinstance(amount, int):
+            current: int = self.pine.read_int32(address)
+
+            value = min(current + amount, maximum)
+            self.pine.write_int32(address, value)
+        elif isinstance(amount, float):
+            current: float = self.pine.read_float(address)
 
-                value = int(min(current + amount, maximum))
-                self.pine.write_float(address, min(current + amount, maximum))
+            value = int(min(current + amount, maximum))
+            self.pine.write_float(address, min(current + amount, maximum))
 
+        if refresh_hud:
             self.update_hud(address_name, value)
 
+        return value
+
+    def give_collectables(self, collectables : dict[str, list[int | float]], is_in_shop : bool = False,
+                          stocks_shuffled : bool = False, monkey_mart : bool = True):
+        """
+        Give several collectables at once, where each resource is given as a pair of its total amount and the number
+        of items that contributed to it. Every resource is read and written only once, and the HUD is refreshed once
+        for all of them.
+        """
+        hud_values : dict[str, int] = {}
+
+        for address_name, (amount, count) in collectables.items():
+            maximum : int | float = Capacities.get(address_name, 0x0)
+            value : Optional[int] = self.give_collectable(address_name, amount, maximum, is_in_shop, stocks_shuffled,
+                                                          monkey_mart, count, False)
+
+            if value is not None:
+                hud_values[address_name] = value
+
+        self.update_huds(hud_values)
+
     def update_hud(self, address_name : str, value : int):
-        if address_name not in HUD_OFFSETS:
+        self.update_huds({address_name : value})
+
+    def update_huds(self, values : dict[str, int]):
+        values = {address_name : value for address_name, value in values.items() if address_name in HUD_OFFSETS}
+        if not values:
             return
 
-        address = self.follow_pointer_chain(self.addresses.GameStates[Game.hud_pointer.value], Game.hud_pointer.value)
-        if address <= 0x0:
+        base_address = self.follow_pointer_chain(self.addresses.GameStates[Game.hud_pointer.value],
+                                                 Game.hud_pointer.value)
+        if base_address <= 0x0:
             return
 
-        # Apply Offset
-        address += HUD_OFFSETS[address_name]
+        for address_name, value in values.items():
+            # Apply Offset
+            address : int = base_address + HUD_OFFSETS[address_name]
 
-        # Get byte length of data and use the correct write function accordingly
-        size : int = ceil(value.bit_length() / 8)
+            # Get byte length of data and use the correct write function accordingly
+            size : int = ceil(value.bit_length() / 8)
 
-        if size <= 1:
-            self.pine.write_int8(address, value)
-        elif 1 < size <= 2:
-            self.pine.write_int16(address, value)
-        elif size > 2:
-            self.pine.write_int32(address, value)
+            if size <= 1:
+                self.pine.write_int8(address, value)
+            elif 1 < size <= 2:
+                self.pine.write_int16(address, value)
+            elif size > 2:
+                self.pine.write_int32(address, value)
 
     def give_morph_energy(self, amount : float = 3.0):
         # Check recharge state first
@@ -752,14 +869,25 @@ class AEPS2Interface:
         as_bytes : bytes = command.encode() + b'\x00'
         self.pine.write_bytes(self.addresses.GameStates[Game.command.value], as_bytes)
 
-    def kill_player(self, cookies_lost : float = 0.0):
+    def kill_player(self, cookies_lost : float = 0.0, cookies : Optional[float] = None):
+        # All writes are composed beforehand and sent as a single batch so the kill lands within one exchange
+        requests : list[tuple[Pine.IPCCommand, int, bytes]] = []
+
         if cookies_lost != 0.0:
-            cookies : float = self.get_cookies()
-            self.set_cookies(max(0.0, cookies - cookies_lost))
+            if cookies is None:
+                cookies = self.get_cookies()
+
+            requests.append((Pine.IPCCommand.WRITE32, self.addresses.GameStates[Game.cookies.value],
+                             struct.pack("<f", max(0.0, cookies - cookies_lost))))
 
         ## self.send_command(Game.kill_player.value) has a transition delay that takes too long
         ## changeArea is more instantaneous, but introduces a buggy respawn when all cookies are depleted
-        self.change_area(self.get_stage())
+        requests.extend(Pine.compose_write_bytes(self.addresses.GameStates[Game.area_dest.value],
+                                                 self.get_stage().encode() + b'\x00'))
+        requests.extend(Pine.compose_write_bytes(self.addresses.GameStates[Game.command.value],
+                                                 Game.change_area.value.encode() + b'\x00'))
+
+        self.pine.batch_write(requests)
 
     def enter_norma(self, destination : str):
         self.set_enter_norma_destination(destination)
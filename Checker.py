@@ -1,11 +1,12 @@
 from typing import TYPE_CHECKING, Set, List
+from collections import Counter
 import random
 import math
 import enum
 
 from NetUtils import NetworkItem
 
-from .data.Items import ACCESSORIES, ArchipelagoItem, EquipmentItem, CollectableItem, UpgradeableItem, Capacities, AP, \
+from .data.Items import ACCESSORIES, ArchipelagoItem, EquipmentItem, CollectableItem, UpgradeableItem, AP, \
     EQUIPMENT
 from .data.Stages import PROGRESS_ID_BY_ORDER
 from .data.Strings import Game, Loc, Itm, APHelper, Stage
@@ -15,12 +16,20 @@ from .data.Locations import ACTORS_INDEX, CELLPHONES_STAGE_INDEX, CAMERAS_STAGE_
     SHOP_CATEGORIES_COLLECTION_DIRECTORY, SHOP_COLLECTION_DIRECTORY, SHOP_PERSISTENT_MASTER, SHOP_PROGRESSION_MORPH, \
     SHOP_BONUS_RC_CARS, SHOP_COLLECTION_BONUS_RC_CARS
 from .data import Items
-from .data.Distribution import CONSOLATION_RATES
+from .AE3_Interface import LevelSelectState
+from .AE3_Consolation import get_prize_table
 
 if TYPE_CHECKING:
     from .AE3_Client import AE3Context
 
 
+class ShopState(enum.IntEnum):
+    NONE = 0
+    ENTERING = 1
+    READY = 2
+    BROWSING = 3
+    PURCHASING = 4
+
 class HintStatus(enum.IntEnum):
     HINT_UNSPECIFIED = 0
     HINT_NO_PRIORITY = 10
@@ -43,19 +52,18 @@ async def check_background_states(ctx : 'AE3Context'):
         ctx.ipc.set_next_channel_choice(ctx.last_selected_channel_index)
         ctx.last_selected_channel_index = -1
 
-    # Enforce Morph Duration
+    # Enforce Morph Duration, only writing when the game differs from what should be set
     if ctx.character >= 0:
-        current_morph_duration : float = ctx.ipc.get_morph_duration(ctx.character)
         dummy: str = ctx.dummy_morph if ctx.dummy_morph_needed else ""
+        targets : tuple[float, ...] = ctx.ipc.get_morph_duration_targets(ctx.morph_duration, dummy)
 
-        if current_morph_duration != ctx.morph_duration or current_morph_duration != 0.0:
-            ctx.ipc.set_morph_duration(ctx.character, ctx.morph_duration, dummy)
+        if ctx.ipc.get_morph_durations(ctx.character) != targets:
+            # Character could be wrong if the durations were already set for them, but still do not match
+            if ctx.applied_morph_durations.get(ctx.character) == targets:
+                ctx.character = ctx.ipc.get_character()
 
-        # Character could be wrong if morph duration still is not equal after the first set
-        current_morph_duration = ctx.ipc.get_morph_duration(ctx.character)
-        if current_morph_duration != ctx.morph_duration or current_morph_duration != 0.0:
-            ctx.character = ctx.ipc.get_character()
             ctx.ipc.set_morph_duration(ctx.character, ctx.morph_duration, dummy)
+            ctx.applied_morph_durations[ctx.character] = targets
 
     # Get which Monkey Group to actively check at the moment based on the stage
     if not new_channel or new_channel is None and not ctx.current_channel:
@@ -108,16 +116,18 @@ async def build_checked_cache(ctx : 'AE3Context'):
 
         return
 
-    await ctx.check_pgc()
-    await ctx.goal_target.check(ctx)
+    await ctx.progress.update(ctx)
 
 # Ensure game is always set to "round2"
 async def correct_progress(ctx : 'AE3Context'):
     ctx.ipc.set_progress()
 
 async def setup_level_select(ctx : 'AE3Context'):
-    is_on_warp_gate: bool = ctx.ipc.is_on_warp_gate()
-    is_a_level_confirmed: bool = ctx.ipc.is_a_level_confirmed()
+    state : LevelSelectState = ctx.ipc.get_level_select_state()
+    is_on_warp_gate: bool = state.on_warp_gate
+    is_a_level_confirmed: bool = state.level_confirmed
+    selected_channel: int = state.selected_channel
+    gui_status: int = state.gui_status
     post_game_state : bool = await ctx.check_pgc()
 
     # Force Unlocked Stages to be in sync with the player's chosen option,
@@ -127,12 +137,9 @@ async def setup_level_select(ctx : 'AE3Context'):
     elif post_game_state and ctx.unlocked_channels < sum(ctx.progression.progression[:-1]):
         ctx.unlocked_channels = ctx.progression.get_progress(ctx.keys, post_game_state)
 
-    if ctx.ipc.get_unlocked_channels() != max(0, min(ctx.unlocked_channels, 0x1B)):
+    if state.unlocked_channels != max(0, min(ctx.unlocked_channels, 0x1B)):
         ctx.ipc.set_unlocked_stages(ctx.unlocked_channels)
 
-    progress : str = ctx.ipc.get_progress()
-    selected_channel: int = ctx.ipc.get_selected_channel()
-
     # In case player scrolls beyond intended levels before unlocked stages are enforced,
     # force selected level to be the latest unlocked stage,
     # except if when a level is to be swapped due to channel shuffle
@@ -142,73 +149,78 @@ async def setup_level_select(ctx : 'AE3Context'):
         if ctx.last_selected_channel_index > ctx.unlocked_channels:
             ctx.last_selected_channel_index = ctx.unlocked_channels
 
-    gui_status: int = ctx.ipc.get_gui_status()
+    # Progress, Boss and Dummy Morph corrections only need to be redone when something relevant to them has changed
+    level_select_key : tuple = (state, ctx.unlocked_channels, ctx.dummy_morph_needed, ctx.dummy_morph_monkey_needed)
+    is_changed : bool = level_select_key != ctx.level_select_key
+    ctx.level_select_key = level_select_key
+
     is_monkey_dummy_set: bool = False
 
     if is_on_warp_gate:
         if ctx.is_using_data_desk:
             ctx.is_using_data_desk = False
 
-        if ctx.dummy_morph_monkey_needed:
-            ctx.ipc.unlock_equipment(Itm.morph_monkey.value)
-            is_monkey_dummy_set = True
+        if is_changed:
+            if ctx.dummy_morph_monkey_needed:
+                ctx.ipc.unlock_equipment(Itm.morph_monkey.value)
+                is_monkey_dummy_set = True
 
-        # Change Progress temporarily for certain levels to be playable. Change back to round2 otherwise.
-        if selected_channel == 0x18 or selected_channel == 0x1A:
-            target_progress : str = APHelper.pr_boss6.value if selected_channel == 0x18 else APHelper.pr_specter1.value
+            # Change Progress temporarily for certain levels to be playable. Change back to round2 otherwise.
+            progress : str = ctx.ipc.get_progress()
+            if selected_channel == 0x18 or selected_channel == 0x1A:
+                target_progress : str = APHelper.pr_boss6.value if selected_channel == 0x18 else APHelper.pr_specter1.value
 
-            if progress != target_progress:
-                ctx.ipc.set_progress(target_progress)
-        elif progress != APHelper.pr_round2.value:
-            ctx.ipc.set_progress()
+                if progress != target_progress:
+                    ctx.ipc.set_progress(target_progress)
+            elif progress != APHelper.pr_round2.value:
+                ctx.ipc.set_progress()
 
-        # Release Bosses as needed to enter the level normally
-        bosses_indexes : list[int] = [0x03, 0x08, 0xC, 0x11, 0x15, -1, 0x1A, 0x1B]
-        if selected_channel in bosses_indexes:
-            boss : str = MONKEYS_BOSSES[bosses_indexes.index(selected_channel)]
-            boss_captured : bool = ctx.ipc.is_location_checked(boss)
+            # Release Bosses as needed to enter the level normally
+            bosses_indexes : list[int] = [0x03, 0x08, 0xC, 0x11, 0x15, -1, 0x1A, 0x1B]
+            if selected_channel in bosses_indexes:
+                boss : str = MONKEYS_BOSSES[bosses_indexes.index(selected_channel)]
+                boss_captured : bool = ctx.ipc.is_location_checked(boss)
 
-            if boss_captured:
-                ctx.ipc.unmark_location(boss)
+                if boss_captured:
+                    ctx.ipc.unmark_location(boss)
 
         # Reset Game Mode Swap state and Set Game Mode value to an unexpected value
         # as sign that the game has not yet set it
-        if ctx.alt_freeplay and not ctx.ipc.is_a_level_confirmed() and ctx.is_mode_swapped:
+        if ctx.alt_freeplay and not is_a_level_confirmed and ctx.is_mode_swapped:
             ctx.is_mode_swapped = False
             ctx.ipc.set_game_mode(0xFFFF, False)
     else:
-        if progress != APHelper.pr_round2.value:
+        if is_changed and ctx.ipc.get_progress() != APHelper.pr_round2.value:
             ctx.ipc.set_progress()
 
             if ctx.suppress_progress_correction:
                 ctx.suppress_progress_correction = False
 
-        ctx.is_using_data_desk = ctx.ipc.is_data_desk_interacted() and ctx.ipc.get_gui_status() >= 1
+        ctx.is_using_data_desk = gui_status >= 1 and ctx.ipc.is_data_desk_interacted()
 
         if ctx.save_state_on_room_transition and not ctx.has_saved_on_transition:
             ctx.has_saved_on_transition = True
             ctx.pending_auto_save = True
 
-        if ctx.load_state_on_connect and not ctx.is_last_save_normal and ctx.ipc.is_saving() and gui_status >= 3:
+        if ctx.load_state_on_connect and not ctx.is_last_save_normal and gui_status >= 3 and ctx.ipc.is_saving():
             ctx.is_last_save_normal = True
             await set_last_save_status(ctx)
 
-        await ctx.check_pgc()
-
     # If Super Monkey isn't properly unlocked yet, temporarily do so during level select to prevent Aki from
     # introducing and giving it to the player. Lock them while on the Pause Menu as well to prevent equipping them
     # from the Quick Morph Menu
-    if ctx.dummy_morph_monkey_needed:
-        if gui_status >= 3 and not is_on_warp_gate:
-            ctx.ipc.lock_equipment(Itm.morph_monkey.value)
-        elif not is_monkey_dummy_set:
-            ctx.ipc.unlock_equipment(Itm.morph_monkey.value)
+    if is_changed:
+        if ctx.dummy_morph_monkey_needed:
+            if gui_status >= 3 and not is_on_warp_gate:
+                ctx.ipc.lock_equipment(Itm.morph_monkey.value)
+            elif not is_monkey_dummy_set:
+                ctx.ipc.unlock_equipment(Itm.morph_monkey.value)
 
-    if ctx.dummy_morph_needed:
-        if gui_status >= 3 and not is_on_warp_gate:
-            ctx.ipc.lock_equipment(ctx.dummy_morph)
-        else:
-            ctx.ipc.unlock_equipment(ctx.dummy_morph)
+        if ctx.dummy_morph_needed:
+            if gui_status >= 3 and not is_on_warp_gate:
+                ctx.ipc.lock_equipment(ctx.dummy_morph)
+            else:
+                ctx.ipc.unlock_equipment(ctx.dummy_morph)
 
     # Reset the spawnpoint properly as the game leaves it blank when coming from TV Station
     if is_a_level_confirmed and is_on_warp_gate:
@@ -247,50 +259,71 @@ async def setup_level_select(ctx : 'AE3Context'):
         if ctx.is_channel_swapped:
             ctx.is_channel_swapped = False
 
-async def setup_shopping_area(ctx : 'AE3Context'):
-    # Recapture Specter2 if already caught, as certain items only appear when he is captured
-    if ctx.ipc.is_location_checked(Loc.boss_specter_final.value):
-        ctx.ipc.mark_location(Loc.boss_specter_final.value)
+async def setup_shopping_area(ctx : 'AE3Context', reapply : bool = False):
+    # Progress only needs to be written when entering the Shopping Area or when anything it depends on has changed,
+    # such as receiving a Channel Key or passing the Post Game Condition while in the Shopping Area
+    shop_key : tuple = (ctx.keys, ctx.progress.pgc_passed, ctx.shop_progress)
+    if reapply or ctx.shop_state is ShopState.ENTERING or shop_key != ctx.shop_key:
+        ctx.shop_key = shop_key
 
-    if ctx.shoppingsanity >= 3:
-        ctx.suppress_progress_correction = True
+        # Recapture Specter2 if already caught, as certain items only appear when he is captured
+        if ctx.ipc.is_location_checked(Loc.boss_specter_final.value):
+            ctx.ipc.mark_location(Loc.boss_specter_final.value)
 
-        progress = ctx.shop_progress
-        if ctx.shoppingsanity == 3:
-            progress = ctx.keys * ctx.shop_progression + ctx.shop_progression - 1
-            if progress >= 27 and not await ctx.check_pgc():
-                progress = math.floor((28 - ctx.shop_progression) / ctx.shop_progression) * ctx.shop_progression - 1
+        if ctx.shoppingsanity >= 3:
+            ctx.suppress_progress_correction = True
+
+            progress = ctx.shop_progress
+            if ctx.shoppingsanity == 3:
+                progress = ctx.keys * ctx.shop_progression + ctx.shop_progression - 1
+                if progress >= 27 and not await ctx.check_pgc():
+                    progress = math.floor((28 - ctx.shop_progression) / ctx.shop_progression) * ctx.shop_progression - 1
 
-        ctx.ipc.set_progress(PROGRESS_ID_BY_ORDER[min(progress, 27)])
+            ctx.ipc.set_progress(PROGRESS_ID_BY_ORDER[min(progress, 27)])
 
+        if ctx.shop_state is ShopState.ENTERING:
+            ctx.shop_state = ShopState.READY
+
+    if not ctx.ticket_consolation:
+        return
+
+    # Coins and Jackets are only compared while the Monkey Mart is open
     gui_status = ctx.ipc.get_gui_status()
-    if ctx.ticket_consolation and gui_status > 0 and ctx.ipc.is_in_monkey_mart():
-        new_coins: int = ctx.ipc.get_coins()
-        if not ctx.has_bought_ticket and ctx.current_coins - new_coins == 30:
-            ctx.has_bought_ticket = True
+    if ctx.shop_state is ShopState.READY:
+        if gui_status > 0 and ctx.ipc.is_in_monkey_mart():
+            ctx.current_coins = ctx.ipc.get_coins()
+            ctx.shop_state = ShopState.BROWSING
+        return
+
+    if gui_status <= 0:
+        ctx.shop_state = ShopState.READY
+        return
+
+    new_coins: int = ctx.ipc.get_coins()
+    if ctx.shop_state is ShopState.BROWSING:
+        if ctx.current_coins - new_coins == 30:
             ctx.current_coins = new_coins
-        elif ctx.has_bought_ticket:
-            if gui_status == 3:
-                ctx.current_coins = new_coins
-                ctx.has_bought_ticket = False
-            elif gui_status == 2:
-                new_jackets = ctx.ipc.get_jackets()
-
-                coin_diff = new_coins - ctx.current_coins
-                jacket_diff = new_jackets - ctx.current_jackets
-
-                rate_type: int = -1
-                if coin_diff == 30 or jacket_diff == 1:
-                    rate_type = 0
-                elif jacket_diff == 3:
-                    rate_type = 1
-
-                if rate_type >= 0:
-                    await roll_consolation(ctx, rate_type)
-
-                ctx.has_bought_ticket = False
-    else:
-        ctx.current_coins = ctx.ipc.get_coins()
+            ctx.shop_state = ShopState.PURCHASING
+    elif ctx.shop_state is ShopState.PURCHASING:
+        if gui_status == 3:
+            ctx.current_coins = new_coins
+            ctx.shop_state = ShopState.BROWSING
+        elif gui_status == 2:
+            new_jackets = ctx.ipc.get_jackets()
+
+            coin_diff = new_coins - ctx.current_coins
+            jacket_diff = new_jackets - ctx.current_jackets
+
+            rate_type: int = -1
+            if coin_diff == 30 or jacket_diff == 1:
+                rate_type = 0
+            elif jacket_diff == 3:
+                rate_type = 1
+
+            if rate_type >= 0:
+                await roll_consolation(ctx, rate_type)
+
+            ctx.shop_state = ShopState.BROWSING
 
 async def set_persistent_values(ctx : 'AE3Context'):
     stocks: int = ctx.ipc.get_morph_stock()
@@ -298,11 +331,8 @@ async def set_persistent_values(ctx : 'AE3Context'):
 
     if ctx.shoppingsanity:
         if ctx.shuffle_chassis:
-            for i in range(len(Itm.get_real_chassis_by_id())):
-                if ctx.ipc.is_location_checked(SHOP_BONUS_RC_CARS[i]):
-                    ctx.ipc.unlock_chassis_direct(i)
-                else:
-                    ctx.ipc.lock_chassis_direct(i)
+            ctx.ipc.set_chassis_direct_states([ctx.ipc.is_location_checked(SHOP_BONUS_RC_CARS[i])
+                                               for i in range(len(Itm.get_real_chassis_by_id()))])
 
         if ctx.shuffle_morph_stock:
             stock_shop_item: int = ctx.ipc.get_shop_morph_stock_checked()
@@ -327,11 +357,7 @@ async def reapply_persistent_values(ctx : 'AE3Context'):
     ctx.is_shop_ready = False
     if ctx.shoppingsanity:
         if ctx.shuffle_chassis:
-            for i, chassis in enumerate(Itm.get_chassis_by_id(no_default=True)):
-                if ctx.ipc.is_chassis_unlocked(chassis):
-                    ctx.ipc.unlock_chassis_direct(i)
-                else:
-                    ctx.ipc.lock_chassis_direct(i)
+            ctx.ipc.set_chassis_direct_states(ctx.ipc.get_chassis_unlocked())
 
         if ctx.shuffle_morph_stock:
             stock_shop_item: int = int(ctx.ipc.get_morph_stock()) - 1
@@ -348,9 +374,9 @@ async def reapply_persistent_values(ctx : 'AE3Context'):
         ctx.ipc.set_morph_gauge_recharge(energy)
 
 async def rebuild_persistent_values(ctx: 'AE3Context'):
-    received_as_id : list[int] = [ i.item for i in ctx.items_received ]
+    ctx.update_items_received_counts()
 
-    stocks: int = received_as_id.count(ctx.items_name_to_id[Itm.acc_morph_stock.value])
+    stocks: int = ctx.items_received_counts[ctx.items_name_to_id[Itm.acc_morph_stock.value]]
 
     if ctx.shoppingsanity:
         if ctx.shuffle_morph_stock:
@@ -358,11 +384,7 @@ async def rebuild_persistent_values(ctx: 'AE3Context'):
             ctx.ipc.set_morph_stock(ctx.ipc.get_shop_morph_stock_checked() + 1)
 
         if ctx.shuffle_chassis:
-            for i, item in enumerate(SHOP_BONUS_RC_CARS):
-                if ctx.ipc.is_location_checked(item):
-                    ctx.ipc.unlock_chassis_direct(i)
-                else:
-                    ctx.ipc.lock_chassis_direct(i)
+            ctx.ipc.set_chassis_direct_states([ctx.ipc.is_location_checked(item) for item in SHOP_BONUS_RC_CARS])
 
     if not ctx.monkey_mart:
         stored_cookies: int = ctx.ipc.get_persistent_cookie_value()
@@ -421,7 +443,7 @@ async def setup_area(ctx : 'AE3Context'):
         else:
             # Set Shopping Area Progress if in Shopping Area
             if ctx.in_shopping_area:
-                await setup_shopping_area(ctx)
+                await setup_shopping_area(ctx, True)
             else:
                 # Temporarily give a morph during transitions to keep Morph Gauge visible
                 # and to spawn Break Room loading zones
@@ -448,32 +470,39 @@ async def setup_area(ctx : 'AE3Context'):
             ctx.pending_auto_save = True
 
 
+async def check_deathlink(ctx : 'AE3Context'):
+    # Both the amount of cookies and the GUI status are read at once, as this is polled at a higher rate
+    cookies, gui_status = ctx.ipc.get_deathlink_state()
+
+    # Check for DeathLinks
+    state_valid_for_death: bool = True
+    if (ctx.in_shopping_area or ctx.in_travel_station) and gui_status > 0:
+        state_valid_for_death = False
+
+    if state_valid_for_death:
+        if ctx.pending_deathlinks and cookies > 0.0:
+            ctx.ipc.kill_player(100.0, cookies)
+            ctx.pending_deathlinks = max(ctx.pending_deathlinks - 1, 0)
+            ctx.receiving_death = True
+            ctx.command_state = 1
+        # Disable the receiving deathlinks flag when deathlinks run out
+        elif not ctx.pending_deathlinks and ctx.receiving_death and cookies > 0.0:
+            ctx.receiving_death = False
+        # Send DeathLinks if there are no more deathlinks occuring
+        elif not ctx.receiving_death:
+            if not ctx.sending_death and cookies <= 0.0:
+                await ctx.send_death()
+                ctx.sending_death = True
+            elif ctx.sending_death and cookies > 0.0:
+                ctx.sending_death = False
+    else:
+        if ctx.receiving_death: ctx.receiving_death = False
+        if ctx.sending_death: ctx.sending_death = False
+
 async def check_states(ctx : 'AE3Context'):
     if not ctx.command_state:
-        cookies: float = ctx.ipc.get_cookies()
-
-        # Check for DeathLinks
-        state_valid_for_death: bool = True
-        if (ctx.in_shopping_area or ctx.in_travel_station) and ctx.ipc.get_gui_status() > 0:
-            state_valid_for_death = False
-
-        if ctx.death_link and state_valid_for_death:
-            if ctx.pending_deathlinks and cookies > 0.0:
-                ctx.ipc.kill_player(100.0)
-                ctx.pending_deathlinks = max(ctx.pending_deathlinks - 1, 0)
-                ctx.receiving_death = True
-                ctx.command_state = 1
-            # Disable the receiving deathlinks flag when deathlinks run out
-            elif not ctx.pending_deathlinks and ctx.receiving_death and cookies > 0.0:
-                ctx.receiving_death = False
-            # Send DeathLinks if there are no more deathlinks occuring
-            elif not ctx.receiving_death:
-                if not ctx.sending_death and cookies <= 0.0:
-                    await ctx.send_death()
-                    ctx.sending_death = True
-                elif ctx.sending_death and cookies > 0.0:
-                    ctx.sending_death = False
-        else:
+        # DeathLinks are handled separately by the DeathLink watcher while enabled
+        if not ctx.death_link:
             if ctx.receiving_death: ctx.receiving_death = False
             if ctx.sending_death: ctx.sending_death = False
 
@@ -507,6 +536,15 @@ async def receive_items(ctx : 'AE3Context'):
     received : List[NetworkItem] = ctx.items_received[ctx.next_item_slot:]
     ctx.next_item_slot += len(received)
     ctx.last_item_processed_index = ctx.next_item_slot
+
+    # Changes to resources are accumulated across the whole batch of received items and only written to the game
+    # once at the end, as large bursts of items (such as from a release) would otherwise need several reads and
+    # writes for every single item
+    collectables : dict[str, list[int | float]] = {}
+    morph_energy : float = 0.0
+    is_morph_duration_changed : bool = False
+    is_shop_stock_received : bool = False
+
     for server_item in received:
         item = Items.from_id(server_item.item)
 
@@ -519,9 +557,7 @@ async def receive_items(ctx : 'AE3Context'):
                 ctx.unlocked_channels = ctx.progression.get_progress(ctx.keys, pgc_checked)
             elif item.item_id == AP[APHelper.shop_stock.value]:
                 ctx.shop_progress += ctx.shop_progression
-
-                if ctx.in_shopping_area:
-                    await setup_shopping_area(ctx)
+                is_shop_stock_received = True
             elif item.item_id == AP[APHelper.hint_book.value]:
                 await get_hint_book_hint(ctx, server_item.location)
 
@@ -566,8 +602,7 @@ async def receive_items(ctx : 'AE3Context'):
                     if item.name != ctx.dummy_morph:
                         ctx.ipc.lock_equipment(ctx.dummy_morph)
 
-                dummy: str = ctx.dummy_morph if ctx.dummy_morph_needed else ""
-                ctx.ipc.set_morph_duration(ctx.character, ctx.morph_duration, dummy)
+                is_morph_duration_changed = True
 
             # Save State if desired
             if ctx.save_state_on_item_received and not ctx.pending_auto_save:
@@ -575,51 +610,56 @@ async def receive_items(ctx : 'AE3Context'):
 
         ## Handle Collectables
         elif isinstance(item, CollectableItem) or isinstance(item, UpgradeableItem):
-            i = item
-            maximum : int | float = 0x0
-
-            # Get Maximum Values
-            if item.resource in Capacities:
-                maximum = Capacities[item.resource]
-
             ### <!> NTSC-U Addresses are used when identifying Items regardless of region
             if item.address == NTSCU.GameStates[Game.nothing.value]:
                 continue
 
             ### Handle Morph Energy
             elif item.resource == Game.morph_gauge_active.value:
-                if ctx.in_shopping_area and not ctx.monkey_mart:
-                    current: int = ctx.ipc.get_persistent_morph_energy_value()
-                    current = min(int(current + i.amount / 10), 110)
-                    ctx.ipc.set_persistent_morph_energy_value(current)
-                else:
-                    ctx.ipc.give_morph_energy(i.amount)
+                morph_energy += item.amount
 
             ### Handle Morph Extension
             elif item.resource == Game.morph_duration.value:
                 ctx.morph_duration += item.amount
-
-                dummy: str = ctx.dummy_morph if ctx.dummy_morph_needed else ""
-                ctx.ipc.set_morph_duration(ctx.character, ctx.morph_duration, dummy)
+                is_morph_duration_changed = True
 
             ### Handle Generic Items
             else:
-                ctx.ipc.give_collectable(item.resource, i.amount, maximum, ctx.in_shopping_area,
-                                         ctx.shuffle_morph_stock, ctx.monkey_mart)
+                collectable : list[int | float] = collectables.setdefault(item.resource, [type(item.amount)(0), 0])
+                collectable[0] += item.amount
+                collectable[1] += 1
 
                 ## Update Locally Tracked Items if so
                 if item.resource == Game.chips.value:
-                    ctx.current_coins += i.amount
+                    ctx.current_coins += item.amount
                 elif item.resource == Game.jackets.value:
                     ctx.current_jackets += 1
 
+    # Apply accumulated changes to the game
+    if collectables:
+        ctx.ipc.give_collectables(collectables, ctx.in_shopping_area, ctx.shuffle_morph_stock, ctx.monkey_mart)
+
+    if morph_energy:
+        if ctx.in_shopping_area and not ctx.monkey_mart:
+            current: int = ctx.ipc.get_persistent_morph_energy_value()
+            current = min(int(current + morph_energy / 10), 110)
+            ctx.ipc.set_persistent_morph_energy_value(current)
+        else:
+            ctx.ipc.give_morph_energy(morph_energy)
+
+    if is_morph_duration_changed:
+        dummy: str = ctx.dummy_morph if ctx.dummy_morph_needed else ""
+        ctx.ipc.set_morph_duration(ctx.character, ctx.morph_duration, dummy)
+
+    if is_shop_stock_received and ctx.in_shopping_area:
+        await setup_shopping_area(ctx, True)
+
     if received:
         # Save Last Item Index Processed into Game Memory
         ctx.ipc.set_last_item_index(ctx.last_item_processed_index)
 
         # Recheck Locations when receiving items for cases when locations are checked manually by the server/host
-        await ctx.goal_target.check(ctx)
-        await ctx.check_pgc()
+        await ctx.progress.update(ctx)
 
 async def resync_important_items(ctx : 'AE3Context'):
     # Do not resync if no items have been processed at all yet
@@ -628,43 +668,49 @@ async def resync_important_items(ctx : 'AE3Context'):
 
     pgc_checked: bool = await ctx.check_pgc()
 
+    ctx.update_items_received_counts()
+    received : Counter[int] = ctx.items_received_counts
+
+    # Snapshot the current state of all Equipment at once, and only write where it differs from what was received
     equipment : list[EquipmentItem] = [ *EQUIPMENT, *ACCESSORIES ]
-    received_id : list[int] = [ item[0] for item in ctx.items_received ]
+    unlocked : dict[str, bool] = ctx.ipc.get_equipment_unlocked([equip.name for equip in equipment])
     for equip in equipment:
-        if equip.item_id in received_id:
-            if not ctx.ipc.is_equipment_unlocked(equip.name):
-                ctx.ipc.unlock_equipment(equip.name, ctx.auto_equip)
+        if not received[equip.item_id] or unlocked[equip.name]:
+            continue
 
-                # Recheck RC Car Unlock
-                if not ctx.rcc_unlocked and equip.item_id in Itm.get_chassis_by_id():
-                    ctx.rcc_unlocked = True
+        ctx.ipc.unlock_equipment(equip.name, ctx.auto_equip)
 
-                # Recheck Water Net Unlock
-                if not ctx.swim_unlocked and equip.name == Itm.gadget_swim.value:
-                    ctx.swim_unlocked = True
+        # Recheck RC Car Unlock
+        if not ctx.rcc_unlocked and equip.name in Itm.get_chassis_by_id():
+            ctx.rcc_unlocked = True
 
-                # Recheck Dummy Morphs Status
-                if equip.name == Itm.morph_monkey.value:
-                    if ctx.dummy_morph_monkey_needed:
-                        ctx.dummy_morph_monkey_needed = False
+        # Recheck Water Net Unlock
+        if not ctx.swim_unlocked and equip.name == Itm.gadget_swim.value:
+            ctx.swim_unlocked = True
 
-                    if ctx.dummy_morph_needed:
-                        ctx.dummy_morph_needed = False
-                elif ctx.dummy_morph_needed and equip.name in Itm.get_morphs_ordered():
-                    ctx.dummy_morph_needed = False
+        # Recheck Dummy Morphs Status
+        if equip.name == Itm.morph_monkey.value:
+            if ctx.dummy_morph_monkey_needed:
+                ctx.dummy_morph_monkey_needed = False
+
+            if ctx.dummy_morph_needed:
+                ctx.dummy_morph_needed = False
+        elif ctx.dummy_morph_needed and equip.name in Itm.get_morphs_ordered():
+            ctx.dummy_morph_needed = False
 
     # Lock Fantasy Knight when it should not be available in case it remains open after dummy_morph_needed has changed
     knight_id : int = ctx.items_name_to_id[Itm.morph_knight.value]
-    if knight_id not in received_id and not ctx.dummy_morph_needed and ctx.ipc.is_equipment_unlocked(
-            Itm.morph_knight.value):
+    if not received[knight_id] and not ctx.dummy_morph_needed and unlocked[Itm.morph_knight.value]:
         ctx.ipc.lock_equipment(Itm.morph_knight.value)
 
     # Resync Channel Keys
-    keys : int = received_id.count(ctx.items_name_to_id[APHelper.channel_key.value])
-    unlocked : int = ctx.progression.get_progress(keys, pgc_checked)
-    if ctx.keys != keys or ctx.unlocked_channels != unlocked:
+    keys : int = received[ctx.items_name_to_id[APHelper.channel_key.value]]
+    unlocked_channels : int = ctx.progression.get_progress(keys, pgc_checked)
+    if ctx.keys != keys or ctx.unlocked_channels != unlocked_channels:
         ctx.keys = keys
-        ctx.unlocked_channels = unlocked
+        ctx.unlocked_channels = unlocked_channels
+
+    if ctx.ipc.get_unlocked_channels() != ctx.unlocked_channels:
         ctx.ipc.set_unlocked_stages(ctx.unlocked_channels)
 
     # Resync Shop Availability
@@ -676,16 +722,16 @@ async def resync_important_items(ctx : 'AE3Context'):
             if progress >= 27 and pgc_checked:
                 progress = math.floor((28 - ctx.shop_progression) / ctx.shop_progression) * ctx.shop_progression - 1
         else:
-            progress: int = received_id.count(ctx.items_name_to_id[APHelper.shop_stock.value])
+            progress: int = received[ctx.items_name_to_id[APHelper.shop_stock.value]]
             progress = (progress + 1) * ctx.shop_progression - 1
 
         if ctx.shop_progress != progress:
             ctx.shop_progress = progress
 
             if ctx.in_shopping_area:
-                await setup_shopping_area(ctx)
+                await setup_shopping_area(ctx, True)
 
-    await ctx.goal_target.check(ctx)
+    await ctx.progress.update(ctx)
 
 async def check_locations(ctx : 'AE3Context'):
     cleared : Set[int] = set()
@@ -796,23 +842,20 @@ async def check_locations(ctx : 'AE3Context'):
             ctx.pending_auto_save = True
 
         if ctx.server:
-            await ctx.send_msgs([{"cmd": "LocationChecks", "locations": cleared}])
-            await ctx.goal_target.check(ctx)
-
-            if await ctx.check_pgc():
-                new_unlocked : int = ctx.progression.get_progress(ctx.keys, True)
-                if ctx.unlocked_channels < new_unlocked:
-                    ctx.unlocked_channels = new_unlocked
-                    ctx.ipc.set_unlocked_stages(ctx.unlocked_channels)
+            ctx.queue_location_checks(cleared)
+            await check_progression(ctx)
         else:
-            ctx.offline_locations_checked.update(cleared)
+            ctx.offline_journal.record(cleared, ctx.last_slot_key)
 
 async def update_offline_checked(ctx : 'AE3Context'):
-    if not ctx.offline_locations_checked:
+    # Send everything not yet sent in one message; Locations stay journaled until the server acknowledges them
+    unsent : set[int] = ctx.offline_journal.get_unsent(ctx.last_slot_key)
+    if not unsent:
         return
 
-    await ctx.send_msgs([{"cmd": "LocationChecks", "locations": ctx.offline_locations_checked}])
-    ctx.offline_locations_checked.clear()
+    ctx.locations_checked.update(unsent)
+    ctx.queue_location_checks(unsent)
+    ctx.offline_journal.mark_sent(unsent)
 
 # Used to check the in-game status of locations as stored in their permanent addresses
 async def sweep_locations(ctx : 'AE3Context', batch : list[str]):
@@ -840,7 +883,7 @@ async def sweep_locations(ctx : 'AE3Context', batch : list[str]):
     # Update Server for Locations checked that it did not know is checked
     cleared = cleared.difference(ctx.checked_locations)
     if cleared and ctx.server:
-        await ctx.send_msgs([{"cmd": "LocationChecks", "locations": cleared}])
+        ctx.queue_location_checks(cleared)
         await check_progression(ctx)
 
 # Handle Re-checking of Shop Items in Collection Type
@@ -861,25 +904,18 @@ async def handle_collection_shop_item_recheck(ctx: 'AE3Context'):
             ctx.locations_checked.difference_update(category_item_ids)
 
     ctx.locations_checked.update(cleared)
+    ctx.progress.touch()
 
     if cleared and ctx.server:
-        await ctx.send_msgs([{"cmd": "LocationChecks", "locations": cleared}])
+        ctx.queue_location_checks(cleared)
         await check_progression(ctx)
 
-        await ctx.check_pgc()
-        await ctx.goal_target.check(ctx)
-
     if not ctx.is_cache_built:
         ctx.is_cache_built = True
 
 async def check_progression(ctx : 'AE3Context'):
-    await ctx.goal_target.check(ctx)
-
-    if await ctx.check_pgc():
-        new_unlocked: int = ctx.progression.get_progress(ctx.keys, True)
-        if ctx.unlocked_channels < new_unlocked:
-            ctx.unlocked_channels = new_unlocked
-            ctx.ipc.set_unlocked_stages(ctx.unlocked_channels)
+    # Reaching the Goal or passing the Post Game Condition is handled by the listeners of ctx.progress
+    await ctx.progress.update(ctx)
 
 def dispatch_dummy_morph(ctx : 'AE3Context', unlock : bool = False):
     if not ctx.dummy_morph or ctx.dummy_morph is None or not ctx.dummy_morph_needed:
@@ -907,12 +943,8 @@ def set_freeplay_mode(ctx : 'AE3Context'):
 async def set_last_save_status(ctx : 'AE3Context'):
     is_last_save_normal : bool = True if ctx.is_last_save_normal is None else ctx.is_last_save_normal
 
-    await ctx.send_msgs([{
-        "cmd": "Set",
-        "key": f"{APHelper.last_save_type.value}_{ctx.team}_{ctx.slot}",
-        "default": True,
-        "operations": [{"operation": "replace", "value": is_last_save_normal}]
-    }])
+    ctx.queue_set(f"{APHelper.last_save_type.value}_{ctx.team}_{ctx.slot}", True,
+                  [{"operation": "replace", "value": is_last_save_normal}])
 
 async def get_last_save_status(ctx : 'AE3Context'):
     await ctx.send_msgs([{
@@ -921,34 +953,22 @@ async def get_last_save_status(ctx : 'AE3Context'):
     }])
 
 async def roll_consolation(ctx : 'AE3Context', rate_type: int):
-    rates: dict[str, float] = {}
-    for p, r in CONSOLATION_RATES[rate_type].items():
-        if p not in ctx.consolation_whitelist:
-            if APHelper.nothing.value not in rates:
-                rates[APHelper.nothing.value] = r
-            else:
-                rates[APHelper.nothing.value] += r
-        else:
-            rates[p] = r
-
-    prize: str = random.choices([*rates.keys()], [*rates.values()])[0]
+    prize: str = get_prize_table(rate_type, frozenset(ctx.consolation_whitelist)).draw()
 
     if prize in PRIZES:
         await PRIZES[prize](ctx)
 
 def get_random_location(ctx : 'AE3Context', *excluded_locations):
-    candidates: list[str] = [*ctx.active_locations.difference(set(excluded_locations))]
-    if not candidates:
-        return ""
-
-    return random.choice(candidates)
+    return ctx.consolation_pool.draw(set(excluded_locations))
 
 
 async def hint_random(ctx : 'AE3Context'):
-    location: int = ctx.locations_name_to_id[get_random_location(ctx)]
+    location: str = get_random_location(ctx)
     if not location: return
 
-    await request_hint(ctx, location, ctx.slot)
+    location_id: int = ctx.locations_name_to_id[location]
+
+    await request_hint(ctx, location_id, ctx.slot)
 
 async def hint_progressive(ctx : 'AE3Context'):
     if 0 not in ctx.pre_hinted: return;
@@ -958,10 +978,15 @@ async def hint_progressive(ctx : 'AE3Context'):
     location_id: int = chosen["id"]
     player: int = chosen["player"]
 
+    if player == ctx.slot:
+        ctx.show_scouted_hint(location_id)
+
     await request_hint(ctx, location_id, player)
 
 async def check_random(ctx : 'AE3Context'):
-    location: str = get_random_location(ctx, *ctx.goal_target.locations, *ctx.post_game_condition.locations)
+    location: str = get_random_location(ctx, *ctx.goal_target.locations,
+                                         *(location for locations in ctx.post_game_condition.locations.values()
+                                           for location in locations))
 
     if not location: return
 
@@ -1023,17 +1048,16 @@ async def get_hint_book_hint(ctx : 'AE3Context', hint_book_loc_id: int):
     location_player: int = ctx.pre_hinted[hint_book_loc_id]["player"]
     location_id: int = ctx.pre_hinted[hint_book_loc_id]["id"]
 
+    if location_player == ctx.slot:
+        ctx.show_scouted_hint(location_id)
+
     await request_hint(ctx, location_id, location_player)
 
 async def send_locations(ctx : 'AE3Context', locations: list[int]):
-    await ctx.send_msgs([{"cmd": "LocationChecks", "locations": locations}])
+    ctx.queue_location_checks(locations)
 
 async def request_hint(ctx : 'AE3Context', location_id: int, player: int):
-    await ctx.send_msgs([{
-        "cmd": "CreateHints",
-        "locations": [location_id],
-        "player": player,
-    }])
+    ctx.queue_hints(player, [location_id])
 
 PRIZES: dict = {
     APHelper.hint_filler.value              : hint_random,
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from BaseClasses import Entrance, Location, Region
 
 from .data.Stages import STAGES_BREAK_ROOMS, STAGES_DIRECTORY, STAGES_MASTER, ENTRANCES_MASTER, STAGES_DIRECTORY_LABEL, \
-    STAGES_SHOP_PROGRESSION, STAGES_FARMABLE, AE3EntranceMeta, STAGES_FARMABLE_SNEAKY_BORG
+    STAGES_SHOP_PROGRESSION
 from .data.Locations import CAMERAS_INDEX, CELLPHONES_INDEX, MONKEYS_PASSWORDS, MONKEYS_INDEX, EVENTS_INDEX, \
     SHOP_PROGRESSION_MASTER, SHOP_PROGRESSION_MORPH, SHOP_COLLECTION_INDEX, CameraLocation, CellphoneLocation, \
     EventMeta, MonkeyLocation, ShopItemLocation, SHOP_PROGRESSION_DIRECTORY, SHOP_EVENT_ACCESS_DIRECTORY, \
@@ -15,6 +15,30 @@ if TYPE_CHECKING:
     from . import AE3World
 
 
+### [< --- REGION GRAPH TEMPLATE --- >]
+# Everything here only depends on static data, so it is built once at import and shared by every player.
+## Channel each Stage belongs to
+STAGE_CHANNELS : dict[str, str] = {stage : channel for channel, stages in reversed(STAGES_DIRECTORY.items())
+                                    for stage in stages}
+
+BREAK_ROOMS : frozenset[str] = frozenset(STAGES_BREAK_ROOMS)
+
+## Entrances present for every player, as (name, parent, destination)
+ENTRANCES_TEMPLATE : tuple[tuple[str, str, str], ...] = tuple((entrance.name, entrance.parent, entrance.destination)
+                                                              for entrance in ENTRANCES_MASTER)
+
+## Location data of each Stage
+MONKEY_METAS : dict[str, tuple[MonkeyLocation, ...]] = {stage : tuple(MonkeyLocation(monkey) for monkey in monkeys)
+                                                        for stage, monkeys in MONKEYS_INDEX.items()}
+CAMERA_METAS : dict[str, CameraLocation] = {stage : CameraLocation(camera) for stage, camera in CAMERAS_INDEX.items()}
+CELLPHONE_METAS : dict[str, tuple[CellphoneLocation, ...]] = {stage : tuple(CellphoneLocation(cellphone)
+                                                                            for cellphone in cellphones)
+                                                              for stage, cellphones in CELLPHONES_INDEX.items()}
+EVENT_METAS : dict[str, tuple[EventMeta, ...]] = {stage : tuple(EventMeta(event) for event in events)
+                                                  for stage, events in EVENTS_INDEX.items()}
+MONKEYS_PASSWORDS_SET : frozenset[str] = frozenset(MONKEYS_PASSWORDS)
+
+
 ### [< --- HELPERS --- >]
 def establish_entrance(player : int, name : str, parent_region : Region, destination : Region,
                        ruleset : Rulesets = None):
@@ -36,78 +60,47 @@ def create_regions(world : "AE3World"):
     add_cameras : bool = bool(world.options.camerasanity)
     add_cellphones : bool = bool(world.options.cellphonesanity.value)
     add_break_rooms : bool = bool(world.options.monkeysanity_break_rooms.value)
+    add_passwords : bool = bool(world.options.monkeysanity_passwords.value)
 
     # Initialize Regions
+    blacklisted_stages : set[str] = {*world.shop_rules.blacklisted_stages}
     stages : dict[str, Region] = {name : Region(name, world.player, world.multiworld) for name in STAGES_MASTER
-                                  if name not in world.shop_rules.blacklisted_stages}
-    entrances : list[AE3EntranceMeta] = [*ENTRANCES_MASTER,
-                                  *world.shop_rules.entrances,
-                                  *world.progression.level_select_entrances]
-    blacklisted_entrances : list[Entrance] = [*world.logic_preference.blacklisted_entrances,
-                                              *world.shop_rules.blacklisted_entrances]
+                                  if name not in blacklisted_stages}
+    entrances : list[tuple[str, str, str]] = [*ENTRANCES_TEMPLATE,
+                                              *((entrance.name, entrance.parent, entrance.destination)
+                                                for entrance in [*world.shop_rules.entrances,
+                                                                 *world.progression.level_select_entrances])]
+    blacklisted_entrances : set[str] = {*world.logic_preference.blacklisted_entrances,
+                                        *world.shop_rules.blacklisted_entrances}
 
     # Connect Regions, building a name->Entrance lookup for indirect condition registration
     entrance_objects : dict[str, Entrance] = {}
-    for entrance in entrances:
-        if entrance.name in blacklisted_entrances:
+    for name, parent_name, destination_name in entrances:
+        if name in blacklisted_entrances:
             continue
 
-        ruleset : Rulesets = Rulesets()
-
-        if entrance.parent in stages:
-            parent = stages[entrance.parent]
-        else:
+        parent : Region = stages.get(parent_name)
+        destination : Region = stages.get(destination_name)
+        if parent is None or destination is None:
             continue
 
-        if entrance.destination in stages:
-            destination = stages[entrance.destination]
-        else:
+        establish_entrance(world.player, name, parent, destination, entrance_rules.get(name))
+        entrance_objects[name] = destination.entrances[-1]
+
+    # Register Indirect Connections, only on the Regions each Entrance's rules actually check the reachability of
+    for name, entrance in entrance_objects.items():
+        ruleset : Rulesets = entrance_rules.get(name)
+        if not ruleset:
             continue
 
-        if entrance.name in entrance_rules:
-            ruleset = entrance_rules[entrance.name]
-
-        establish_entrance(world.player, entrance.name, parent, destination, ruleset)
-        entrance_objects[entrance.name] = destination.entrances[-1]
-
-    # Register Indirect Connections
-    farm_entrances : set[str] = set()
-    pgc_entrances : set[str] = set()
-
-    if world.options.shoppingsanity.value >= 1:
-        farm_entrances.add(Stage.entrance_shop_expensive.value)
-        if world.options.cheap_items_minimum_requirement:
-            farm_entrances.add(Stage.entrance_travel_ab.value)
-
-    if world.options.post_game_condition_cameras:
-        pgc_entrances.update(entrance_rules.keys() & world.progression.pgc_entrance_names)
-
-        if world.options.shoppingsanity.value >= 1:
-            pgc_entrances.update(world.shop_rules.post_game_entrances)
-            if world.options.cheap_items_minimum_requirement.value >= 100:
-                pgc_entrances.add(Stage.entrance_travel_ab.value)
-
-    if farm_entrances:
-        farmable_stages : list[str] = [*STAGES_FARMABLE]
-        if world.options.farm_logic_sneaky_borgs.value:
-            farmable_stages.extend(STAGES_FARMABLE_SNEAKY_BORG)
-        farmable_regions = [region for name, region in stages.items() if name in farmable_stages]
-        for ent_name in farm_entrances:
-            if ent_name in entrance_objects:
-                for region in farmable_regions:
-                    world.multiworld.register_indirect_condition(region, entrance_objects[ent_name])
-
-    if pgc_entrances:
-        camera_regions = [region for name, region in stages.items() if name in CAMERAS_INDEX]
-        for ent_name in pgc_entrances:
-            if ent_name in entrance_objects:
-                for region in camera_regions:
-                    world.multiworld.register_indirect_condition(region, entrance_objects[ent_name])
+        for region_name in ruleset.get_regions():
+            if region_name in stages:
+                world.multiworld.register_indirect_condition(stages[region_name], entrance)
 
     # Define Regions
-    blacklist : list[str] = [stage for channel in world.options.blacklist_channel.value
-                             for stage in STAGES_DIRECTORY_LABEL[channel]
-                             if channel in STAGES_DIRECTORY_LABEL]
+    blacklist : set[str] = {stage for channel in world.options.blacklist_channel.value
+                            if channel in STAGES_DIRECTORY_LABEL
+                            for stage in STAGES_DIRECTORY_LABEL[channel]}
 
     for stage in stages.values():
         # Skip Blacklisted Stages
@@ -116,49 +109,39 @@ def create_regions(world : "AE3World"):
 
         # Skip stage if Monkeysanity Break Rooms is enabled and the stage is a break room.
         # It should be safe to skip outright since there are no break rooms with Cameras or Cellphones in them.
-        if not add_break_rooms and stage.name in STAGES_BREAK_ROOMS:
+        if not add_break_rooms and stage.name in BREAK_ROOMS:
             continue
 
         # Define Locations
         ## Monkeys
-        if stage.name in MONKEYS_INDEX:
-            for monkeys in MONKEYS_INDEX[stage.name]:
-                if not world.options.monkeysanity_passwords and monkeys in MONKEYS_PASSWORDS:
+        if stage.name in MONKEY_METAS:
+            for meta in MONKEY_METAS[stage.name]:
+                monkeys : str = meta.name
+                if not add_passwords and monkeys in MONKEYS_PASSWORDS_SET:
                     continue
 
-                meta : MonkeyLocation = MonkeyLocation(monkeys)
                 loc : Location = meta.to_location(world.player, stage)
 
-                # Initialize Ruleset for Location
-                ruleset : Rulesets = Rulesets()
-                if monkeys in world.logic_preference.monkey_rules.keys():
-                    ruleset = world.logic_preference.monkey_rules[monkeys]
-
-                ruleset.critical.update(world.logic_preference.default_critical_rule)
+                # Initialize Ruleset for Location. The LogicPreference may be shared with other players,
+                # so its Rulesets are merged into a new one rather than modified
+                ruleset : Rulesets = Rulesets(critical={*world.logic_preference.default_critical_rule})
+                if monkeys in world.logic_preference.monkey_rules:
+                    ruleset.update(world.logic_preference.monkey_rules[monkeys])
 
                 loc.access_rule = ruleset.condense(world.player)
 
                 stage.locations.append(loc)
 
         ## Cameras
-        if add_cameras and stage.name in CAMERAS_INDEX:
-            camera : str = CAMERAS_INDEX[stage.name]
-            meta : CameraLocation = CameraLocation(camera)
-            loc : Location = meta.to_location(world.player, stage)
+        if add_cameras and stage.name in CAMERA_METAS:
+            loc : Location = CAMERA_METAS[stage.name].to_location(world.player, stage)
 
             # Add Access Rule for completing the stage to ensure maximum accessibility,
             # if the player chooses to require the monkey actors for the Cameras,
             # and they did not choose to have early Freeplay
             if world.options.camerasanity == 1 and not world.options.early_free_play:
                 ruleset : Rulesets = Rulesets()
-                parent_channel : str = ""
-                for channel, regions in STAGES_DIRECTORY.items():
-                    if not stage.name in regions:
-                        continue
-
-                    parent_channel = channel
-                    break
-
+                parent_channel : str = STAGE_CHANNELS.get(stage.name, "")
                 if parent_channel:
                     ruleset = world.logic_preference.get_channel_clear_rules(parent_channel)
 
@@ -168,17 +151,16 @@ def create_regions(world : "AE3World"):
 
         ## Cellphones
         if add_cellphones:
-            if stage.name in CELLPHONES_INDEX:
-                for cellphone in CELLPHONES_INDEX[stage.name]:
-                    meta : CellphoneLocation = CellphoneLocation(cellphone)
+            if stage.name in CELLPHONE_METAS:
+                for meta in CELLPHONE_METAS[stage.name]:
                     loc : Location = meta.to_location(world.player, stage)
 
                     stage.locations.append(loc)
 
         ## Events
-        if stage.name in EVENTS_INDEX:
-            for event in EVENTS_INDEX[stage.name]:
-                meta : EventMeta = EventMeta(event)
+        if stage.name in EVENT_METAS:
+            for meta in EVENT_METAS[stage.name]:
+                event : str = meta.name
                 loc : Location = meta.to_event_location(world.player, stage)
 
                 if event in world.logic_preference.event_rules:
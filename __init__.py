@@ -3,19 +3,19 @@ from typing import ClassVar, List, TextIO
 import logging
 
 from worlds.AutoWorld import World, WebWorld
-from BaseClasses import MultiWorld, Tutorial, Location
+from BaseClasses import MultiWorld, Tutorial, Location, CollectionState, Item
 from Options import OptionError
 import settings
 
 from .data.Items import AE3Item, AE3ItemMeta, ITEMS_MASTER, Nothing, generate_collectables
-from .data.Locations import Cellphone_Name_to_ID, MONKEYS_BOSSES, MONKEYS_MASTER_ORDERED, CAMERAS_MASTER_ORDERED, \
-    CELLPHONES_MASTER_ORDERED, MONKEYS_PASSWORDS, MONKEYS_BREAK_ROOMS, SHOP_PROGRESSION_75COMPLETION, \
+from .data.Locations import MONKEYS_BOSSES, MONKEYS_PASSWORDS, MONKEYS_BREAK_ROOMS, SHOP_PROGRESSION_75COMPLETION, \
     SHOP_EVENT_ACCESS_DIRECTORY, SHOP_HINT_BOOK, SHOP_COLLECTION_HINT_BOOK, SHOP_PERSISTENT_HINT_BOOK
 from .data.Stages import LEVELS_BY_ORDER, STAGES_BOSSES, STAGES_BREAK_ROOMS, STAGES_DIRECTORY_LABEL
 from .data.Rules import GoalTarget, GoalTargetOptions, LogicPreference, LogicPreferenceOptions, PostGameCondition, \
-    ShopItemRules
+    ShopItemRules, get_logic_preference
 from .data.Strings import Loc, Meta, APHelper, APConsole, Itm
-from .data.Logic import is_goal_achieved, are_goals_achieved, Rulesets, ProgressionMode, ProgressionModeOptions
+from .data.Logic import is_goal_achieved, are_goals_achieved, Rulesets, ProgressionMode, ProgressionModeOptions, \
+    EQUIPMENT_BITS
 from .AE3_Options import AE3Options, create_option_groups, slot_data_options
 from .Regions import create_regions
 from .data import Items, Locations
@@ -238,22 +238,14 @@ class AE3World(World):
                                   "or choose a different progression mode.")
 
 
-        # Get Logic Preference
-        self.logic_preference = LogicPreferenceOptions[self.options.logic_preference]()
-        self.logic_preference.apply_unlimited_gadget_float_rules(
-            bool(self.options.hip_drop_storage_logic.value),
-            bool(self.options.prolonged_quad_jump_logic.value),
-        )
+        # Force-enable shoppingsanity early if required by goal target or post-game condition
+        goal_target_index = self.options.goal_target.value
+        if goal_target_index == 7 or self.options.post_game_condition_shop:
+            if not self.options.shoppingsanity:
+                self.options.shoppingsanity.value = 1
 
-        if self.options.base_morph_duration.value >= 30 or self.options.add_morph_extensions.value:
-            self.logic_preference.apply_timed_kung_fu_rule(
-                self.options.base_morph_duration.value,
-                bool(self.options.add_morph_extensions.value)
-            )
-            self.logic_preference.apply_timed_morph_float(
-                self.options.base_morph_duration.value,
-                bool(self.options.add_morph_extensions.value)
-            )
+        # Get Logic Preference, shared with other players that have the same logic options
+        self.logic_preference = get_logic_preference(self.options)
 
         # Get ProgressionMode
         self.progression = ProgressionModeOptions[self.options.progression_mode.value](self)
@@ -275,20 +267,8 @@ class AE3World(World):
         exclude_locations.extend(MONKEYS_PASSWORDS)
 
         # Exclude Blacklisted Channels
-        # Exclude Channels in Post Game from being required for Post Game to be unlocked
-        if self.progression.progression[-1]:
-            for channel in self.progression.order[-self.progression.progression[-1]:]:
-                exclude_locations.extend(MONKEYS_MASTER_ORDERED[channel])
-                exclude_locations.append(CAMERAS_MASTER_ORDERED[channel])
-
-                excluded_phones_id: list[str] = CELLPHONES_MASTER_ORDERED[channel]
-                exclude_locations.extend(Cellphone_Name_to_ID[cell_id] for cell_id in excluded_phones_id)
-
-        # Force-enable shoppingsanity early if required by goal target or post-game condition
-        goal_target_index = self.options.goal_target.value
-        if goal_target_index == 7 or self.options.post_game_condition_shop:
-            if not self.options.shoppingsanity:
-                self.options.shoppingsanity.value = 1
+        blacklisted_locations, post_game_locations = self.progression.get_excluded_locations()
+        exclude_locations.extend(blacklisted_locations)
 
         # Exclude Shop Items based on Shoppingsanity Type and Blacklisted Channels
         if self.options.blacklist_channel.value and self.options.shoppingsanity.value > 0:
@@ -333,14 +313,9 @@ class AE3World(World):
 
         # Exclude Channels in Post Game from being required for Post Game to be unlocked
         post_game_start_index = sum(self.progression.progression[:-2]) + 1
+        exclude_locations.extend(post_game_locations)
         for channel in (self.progression.order[post_game_start_index :
         post_game_start_index + self.progression.progression[-2]]):
-            exclude_locations.extend(MONKEYS_MASTER_ORDERED[channel])
-            exclude_locations.append(CAMERAS_MASTER_ORDERED[channel])
-
-            excluded_phones_id : list[str] = CELLPHONES_MASTER_ORDERED[channel]
-            exclude_locations.extend(Cellphone_Name_to_ID[cell_id] for cell_id in excluded_phones_id)
-
             for region, item in SHOP_EVENT_ACCESS_DIRECTORY.items():
                 if region in [*STAGES_DIRECTORY_LABEL.values()][channel]:
                     exclude_locations.extend(item)
@@ -399,9 +374,6 @@ class AE3World(World):
 
         self.exclude_locations = exclude_locations
 
-        # Once options are resolved, apply logic dependent on options
-        self.logic_preference.apply_option_logic(self.options)
-
         # self.log_debug()
 
     def create_regions(self):
@@ -415,6 +387,33 @@ class AE3World(World):
 
         return Nothing.to_item(self.player)
 
+    def collect(self, state : CollectionState, item : Item) -> bool:
+        change : bool = super().collect(state, item)
+        if not change:
+            return change
+
+        # Keep the Equipment mask used by compiled access rules up to date
+        if item.name in EQUIPMENT_BITS:
+            state.prog_items[self.player][APHelper.equipment_mask.value] |= EQUIPMENT_BITS[item.name]
+
+        # Count changes to the state, so that cached reachability knows when to be checked again
+        state.prog_items[self.player][APHelper.state_version.value] += 1
+
+        return change
+
+    def remove(self, state : CollectionState, item : Item) -> bool:
+        change : bool = super().remove(state, item)
+        if not change:
+            return change
+
+        if item.name in EQUIPMENT_BITS and not state.prog_items[self.player][item.name]:
+            state.prog_items[self.player][APHelper.equipment_mask.value] &= ~EQUIPMENT_BITS[item.name]
+
+        state.prog_items[self.player][APHelper.state_version.value] += 1
+        state.prog_items[self.player][APHelper.state_removals.value] += 1
+
+        return change
+
     def create_items(self):
         # Define Items
         stun_club = Items.Gadget_Club.to_item(self.player)
@@ -768,13 +767,8 @@ class AE3World(World):
                 excluded_stages.extend([*STAGES_BREAK_ROOMS])
 
             ### Exclude Blacklisted Channels from Goal Target and Post Game Condition
-            if self.progression.progression[-1]:
-                for channel in self.progression.order[-self.progression.progression[-1]:]:
-                    excluded_locations.extend(MONKEYS_MASTER_ORDERED[channel])
-                    excluded_locations.append(CAMERAS_MASTER_ORDERED[channel])
-
-                    excluded_phones_id: list[str] = CELLPHONES_MASTER_ORDERED[channel]
-                    excluded_locations.extend(Cellphone_Name_to_ID[cell_id] for cell_id in excluded_phones_id)
+            blacklisted_locations, post_game_locations = self.progression.get_excluded_locations()
+            excluded_locations.extend(blacklisted_locations)
 
             # Exclude Ultim-ape Fighter if any blacklisted channels exist
             if self.progression.progression[-1]:
@@ -816,14 +810,7 @@ class AE3World(World):
                     amounts[APHelper.keys.value] = slot_data[APHelper.pgc_keys.value]
 
                 # Exclude Channels in Post Game from being required for Post Game to be unlocked
-                post_game_start_index = sum(self.progression.progression[:-2]) + 1
-                for channel in (self.progression.order[post_game_start_index:
-                post_game_start_index + self.progression.progression[-2]]):
-                    excluded_locations.extend(MONKEYS_MASTER_ORDERED[channel])
-                    excluded_locations.append(CAMERAS_MASTER_ORDERED[channel])
-
-                    excluded_phones_id: list[str] = CELLPHONES_MASTER_ORDERED[channel]
-                    excluded_locations.extend(Cellphone_Name_to_ID[cell_id] for cell_id in excluded_phones_id)
+                excluded_locations.extend(post_game_locations)
 
                 # Exclude Ultim-ape Fighter from being a PGC requirement, as it requires as many monkeys as possible
                 excluded_locations.extend(SHOP_PROGRESSION_75COMPLETION)
@@ -1,11 +1,27 @@
+import os
+
 from worlds.LauncherComponents import Component, Type, components, launch
 
 from .data.Strings import APConsole, Meta
 
-def run_client(*args: str) -> None:
-    from .AE3_Client import launch_init
+def launch_client(*args: str) -> None:
+    # Runs in the client's own process rather than the Launcher's.
+    # Headless Mode has to be known before the client is imported, as it decides whether the tracker is loaded,
+    # so it is only set for the import and never carries over to the Launcher or anything started afterward
+    previous = os.environ.get("AE3_CLIENT_HEADLESS")
+    os.environ["AE3_CLIENT_HEADLESS"] = "1" if "--headless" in args else "0"
+    try:
+        from .AE3_Client import launch_init
+    finally:
+        if previous is None:
+            os.environ.pop("AE3_CLIENT_HEADLESS", None)
+        else:
+            os.environ["AE3_CLIENT_HEADLESS"] = previous
 
-    launch(launch_init, name=APConsole.Info.client_name.value, args=args)
+    launch_init(*args)
+
+def run_client(*args: str) -> None:
+    launch(launch_client, name=APConsole.Info.client_name.value, args=args)
 
 components.append(
         Component(
@@ -232,18 +232,20 @@ ITEMS_INDEX : Sequence[Sequence] = [
     ITEMS_MASTER, GADGETS, MORPHS, EQUIPMENT, ACCESSORIES, UPGRADEABLES, COLLECTABLES, ARCHIPELAGO
 ]
 
+## Items of each category in ITEMS_INDEX by their ID, going in reverse so that the first Item of an ID is kept
+ITEMS_BY_ID : Sequence[dict[int, AE3ItemMeta]] = [{i.item_id : i for i in reversed(category)}
+                                                  for category in ITEMS_INDEX]
+
+ITEMS_NAME_TO_ID : dict[str, int] = {i.name : i.item_id for i in ITEMS_MASTER}
+
 ### [< --- METHODS --- >]
 def from_id(item_id = int, category : int = 0):
     """Get Item by its ID"""
-    ref : Sequence = ITEMS_INDEX[category]
-
-    i : AE3ItemMeta = next((i for i in ref if i.item_id == item_id), None)
-    return i
+    return ITEMS_BY_ID[category].get(item_id)
 
 def generate_name_to_id() -> dict[str : int]:
     """Get a Dictionary of all Items in Name-ID pairs"""
-    i : AE3ItemMeta
-    return {i.name : i.item_id for i in ITEMS_MASTER}
+    return dict(ITEMS_NAME_TO_ID)
 
 def generate_item_groups() -> dict[str : set[str]]:
     """Get a Dictionary of Item Groups"""
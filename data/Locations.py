@@ -1,5 +1,7 @@
-from typing import Sequence
+from typing import Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from abc import ABC
 import copy
 
@@ -3477,27 +3479,96 @@ LOCATIONS_DIRECTORY : dict[str, Sequence[str]] = {
     APHelper.shop.value : [*SHOP_UNIQUE_MASTER, *SHOP_COLLECTION_MASTER]
 }
 
-def generate_name_to_id() -> dict[str, int]:
+## Monkeys, Cameras and Cellphones of each Channel, in the order of LEVELS_BY_ORDER
+CHANNEL_LOCATIONS : Sequence[frozenset[str]] = tuple(
+    frozenset({*MONKEYS_MASTER_ORDERED[i],
+               *([CAMERAS_MASTER_ORDERED[i]] if CAMERAS_MASTER_ORDERED[i] else []),
+               *(Cellphone_Name_to_ID[cell_id] for cell_id in CELLPHONES_MASTER_ORDERED[i])})
+    for i in range(len(LEVELS_BY_ORDER))
+)
+
+@lru_cache(maxsize=None)
+def get_channel_exclusions(order : tuple[int, ...], progression : tuple[int, ...]) \
+        -> tuple[frozenset[str], frozenset[str]]:
+    """
+    Get the Locations of the Blacklisted Channels and of the Post Game Channels for a Channel order and progression,
+    as neither count towards the Goal Target or the Post Game Condition.
+    """
+    blacklisted : frozenset[str] = frozenset()
+    if progression[-1]:
+        blacklisted = blacklisted.union(*(CHANNEL_LOCATIONS[channel] for channel in order[-progression[-1]:]))
+
+    post_game_start_index : int = sum(progression[:-2]) + 1
+    post_game : frozenset[str] = frozenset().union(*(CHANNEL_LOCATIONS[channel] for channel in
+                                                     order[post_game_start_index:
+                                                           post_game_start_index + progression[-2]]))
+
+    return blacklisted, post_game
+
+class LocationTables:
+    """
+    Lookups between the names, IDs, categories and addresses of every Location, built once and shared.
+
+    Locations are given dense indices in the order of their IDs, so that values of each Location are kept in tuples
+    rather than in separate dictionaries keyed by ID.
+    """
+    name_to_id : Mapping[str, int]
+    index : Mapping[int, int]
+
+    ids : tuple[int, ...]
+    names : tuple[str, ...]
+    categories : tuple[str, ...]
+    addresses : tuple[int, ...]
+
+    def __init__(self, metas : Iterable[tuple[str, AE3LocationMeta]]):
+        # Later Locations of the same name take the place of earlier ones
+        by_name : dict[str, tuple[str, AE3LocationMeta]] = {meta.name : (category, meta) for category, meta in metas}
+        ordered : list[tuple[str, AE3LocationMeta]] = sorted(by_name.values(), key=lambda entry : entry[1].loc_id)
+
+        self.name_to_id = MappingProxyType({name : meta.loc_id for name, (_, meta) in by_name.items()})
+        self.index = MappingProxyType({meta.loc_id : i for i, (_, meta) in enumerate(ordered)})
+
+        self.ids = tuple(meta.loc_id for _, meta in ordered)
+        self.names = tuple(meta.name for _, meta in ordered)
+        self.categories = tuple(category for category, _ in ordered)
+        self.addresses = tuple(meta.address for _, meta in ordered)
+
+    def get_name(self, loc_id : int) -> str:
+        return self.names[self.index[loc_id]]
+
+    def get_category(self, loc_id : int) -> str:
+        return self.categories[self.index[loc_id]]
+
+    def get_address(self, loc_id : int) -> int:
+        return self.addresses[self.index[loc_id]]
+
+@lru_cache(maxsize=None)
+def get_location_tables() -> LocationTables:
+    """Get the shared lookup tables of all Locations, building them when first needed."""
+    metas : list[tuple[str, AE3LocationMeta]] = []
+
     # Monkeys
-    name_to_id : dict[str, int] = { name : MonkeyLocation(name).loc_id for name in MONKEYS_MASTER }
+    metas.extend((APHelper.monkey.value, MonkeyLocation(name)) for name in MONKEYS_MASTER)
 
     # Cameras
-    name_to_id.update({ cam.name : cam.loc_id for cam in [CameraLocation(name) for name in CAMERAS_MASTER] })
+    metas.extend((APHelper.camera.value, CameraLocation(name)) for name in CAMERAS_MASTER)
 
     # Cellphones
-    name_to_id.update({ cell.name : cell.loc_id for cell in [CellphoneLocation(name) for name in CELLPHONES_MASTER] })
+    metas.extend((APHelper.cellphone.value, CellphoneLocation(name)) for name in CELLPHONES_MASTER)
 
     # Shop Items
     ## Unique Type
-    name_to_id.update({ item.name : item.loc_id for item in [ShopItemLocation(name) for name in SHOP_UNIQUE_MASTER] })
+    metas.extend((APHelper.shop.value, ShopItemLocation(name)) for name in SHOP_UNIQUE_MASTER)
 
     ## Collection Type
     for category_index, category in enumerate(SHOP_COLLECTION_INDEX):
         for offset, item in enumerate(category):
-            meta: ShopItemLocation = ShopItemLocation(item, category_index, offset)
-            name_to_id[item] = meta.loc_id
+            metas.append((APHelper.shop.value, ShopItemLocation(item, category_index, offset)))
 
-    return name_to_id
+    return LocationTables(metas)
+
+def generate_name_to_id() -> dict[str, int]:
+    return dict(get_location_tables().name_to_id)
 
 def generate_location_groups() -> dict[str, int]:
     groups: dict[str: set[str]] = {}
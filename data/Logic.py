@@ -1,10 +1,12 @@
-from copy import deepcopy
-from typing import TYPE_CHECKING, Set, Sequence, Callable
+from typing import TYPE_CHECKING, Set, Sequence, Callable, Iterable, NamedTuple, Union
+from collections import Counter
 import warnings
+import weakref
 
 from BaseClasses import CollectionState, Item
 
-from .Items import Channel_Key
+from .Items import Channel_Key, EQUIPMENT, ACCESSORIES, generate_item_groups
+from .Locations import get_channel_exclusions
 from .Stages import AE3EntranceMeta, ENTRANCES_STAGE_SELECT, ENTRANCES_CHANNELS, LEVELS_BY_ORDER, STAGES_FARMABLE, \
     STAGES_FARMABLE_SNEAKY_BORG
 from .Strings import Itm, Stage, APHelper
@@ -144,37 +146,44 @@ def can_reach_region(state : CollectionState, player : int, region : str):
     return state.can_reach_region(region, player)
 
 def can_access_region(region : str):
-    return lambda state, player : can_reach_region(state, player, region)
+    return with_regions(lambda state, player : can_reach_region(state, player, region), region)
 
 def can_farm_boxes():
-    return lambda state, player : any(can_reach_region(state, player, region) for region in STAGES_FARMABLE)
+    return with_regions(lambda state, player : any(can_reach_region(state, player, region)
+                                                   for region in STAGES_FARMABLE), *STAGES_FARMABLE)
 
 def can_farm_sneaky_borgs():
-    return lambda state, player : any(can_reach_region(state, player, region) for region in STAGES_FARMABLE_SNEAKY_BORG)
+    return with_regions(lambda state, player : any(can_reach_region(state, player, region)
+                                                   for region in STAGES_FARMABLE_SNEAKY_BORG),
+                        *STAGES_FARMABLE_SNEAKY_BORG)
 
 def has_enough_morph_stocks(state : CollectionState, player : int, stocks : int = 1):
     return state.has(Itm.acc_morph_stock.value, player, stocks)
 
 def has_morph_stocks(stocks : int = 1):
-    return lambda state, player : has_enough_morph_stocks(state, player, stocks)
+    return with_requirements(lambda state, player : has_enough_morph_stocks(state, player, stocks),
+                             (Itm.acc_morph_stock.value, stocks))
 
 def has_enough_morph_extensions(state : CollectionState, player : int, extensions : int = 10):
     return state.has(Itm.acc_morph_ext.value, player, extensions)
 
 def has_morph_extensions(extensions: int = 10):
-    return lambda state, player : has_enough_morph_extensions(state, player, extensions)
+    return with_requirements(lambda state, player : has_enough_morph_extensions(state, player, extensions),
+                             (Itm.acc_morph_ext.value, extensions))
 
 def has_enough_keys(state : CollectionState, player : int, keys : int):
     return state.has(APHelper.channel_key.value, player, keys)
 
 def has_keys(keys : int):
-    return lambda state, player : has_enough_keys(state, player, keys=keys)
+    return with_requirements(lambda state, player : has_enough_keys(state, player, keys=keys),
+                             (APHelper.channel_key.value, keys))
 
 def has_enough_shop_stock(state : CollectionState, player : int, stock : int):
     return state.has(APHelper.shop_stock.value, player, stock)
 
 def has_shop_stock(stock : int):
-    return lambda state, player : has_enough_shop_stock(state, player, stock)
+    return with_requirements(lambda state, player : has_enough_shop_stock(state, player, stock),
+                             (APHelper.shop_stock.value, stock))
 
 # Event Checks
 def is_event_invoked(state : CollectionState, player : int, event_name : str):
@@ -184,13 +193,88 @@ def is_event_not_invoked(state : CollectionState, player : int, event_name : str
     return not state.has(event_name, player)
 
 def event_invoked(event_name : str):
-    return lambda state, player : is_event_invoked(state, player, event_name)
+    return with_requirements(lambda state, player : is_event_invoked(state, player, event_name),
+                             frozenset({event_name}))
 
 def is_goal_achieved(state : CollectionState, player : int, count : int = 1):
     return state.has(APHelper.victory.value, player, count)
 
 def are_goals_achieved(goal_count : int):
-    return lambda state, player : is_goal_achieved(state, player, goal_count)
+    return with_requirements(lambda state, player : is_goal_achieved(state, player, goal_count),
+                             (APHelper.victory.value, goal_count))
+
+### [< --- RULE REQUIREMENTS --- >]
+# Items asked for by an access rule. A set of names needs at least one of the Items in it, while a (name, count) pair
+# needs at least that many of the Item. Rules with no requirements described are called as they are.
+Requirement = Union[frozenset[str], tuple[str, int]]
+
+def with_requirements(rule : Callable, *requirements : Requirement) -> Callable:
+    """Describe the Items a rule asks for, so that compiled Rulesets can check them directly instead of calling it."""
+    rule.requirements = requirements
+    return rule
+
+def with_regions(rule : Callable, *regions : str) -> Callable:
+    """Describe the Regions a rule checks the reachability of, so that Entrances using it only depend on those."""
+    rule.regions = frozenset(regions)
+    return rule
+
+ITEM_GROUPS : dict[str, set[str]] = generate_item_groups()
+
+# Each Equipment Item has a bit in a mask kept alongside the player's collected Items, so that rules asking only for
+# Equipment can be evaluated in one lookup. The mask is kept up to date in AE3World.collect and AE3World.remove.
+EQUIPMENT_BITS : dict[str, int] = {equipment.name : 1 << i for i, equipment in enumerate([*EQUIPMENT, *ACCESSORIES])}
+
+def to_equipment_bits(names : Iterable[str]) -> int:
+    bits : int = 0
+    for name in names:
+        bits |= EQUIPMENT_BITS[name]
+
+    return bits
+
+def group(name : str) -> frozenset[str]:
+    return frozenset(ITEM_GROUPS[name])
+
+def item(*names : str) -> frozenset[str]:
+    return frozenset(names)
+
+with_requirements(can_catch, item(Itm.gadget_net.value, *ITEM_GROUPS[APHelper.morphs_no_monkey.value]))
+with_requirements(can_catch_long, group(APHelper.catch_long.value))
+with_requirements(can_net, item(Itm.gadget_net.value))
+with_requirements(can_morph, group(APHelper.morphs.value))
+with_requirements(can_morph_not_monkey, group(APHelper.morphs_no_monkey.value))
+
+with_requirements(has_radar, item(Itm.gadget_radar.value))
+with_requirements(has_club, item(Itm.gadget_club.value))
+with_requirements(has_hoop, item(Itm.gadget_hoop.value))
+with_requirements(has_flyer, item(Itm.gadget_fly.value))
+with_requirements(can_sling, item(Itm.gadget_sling.value))
+with_requirements(can_swim, item(Itm.gadget_swim.value))
+with_requirements(can_rcc, group(APHelper.rc_cars.value))
+
+with_requirements(can_knight, item(Itm.morph_knight.value))
+with_requirements(can_cowboy, item(Itm.morph_cowboy.value))
+with_requirements(can_ninja, item(Itm.morph_ninja.value))
+with_requirements(can_genie, item(Itm.morph_magician.value))
+with_requirements(can_kungfu, item(Itm.morph_kungfu.value))
+with_requirements(can_hero, item(Itm.morph_hero.value))
+with_requirements(can_monkey, item(Itm.morph_monkey.value))
+
+with_requirements(can_attack, group(APHelper.attack.value))
+with_requirements(can_hit, group(APHelper.hit.value))
+with_requirements(can_dash, group(APHelper.dash.value))
+with_requirements(can_shoot, group(APHelper.shoot.value))
+with_requirements(can_shoot_boom, group(APHelper.shoot.value), item(Itm.ammo_boom.value))
+with_requirements(can_fly, group(APHelper.fly.value))
+with_requirements(can_glide, group(APHelper.glide.value))
+
+with_requirements(can_boost_fly, item(Itm.gadget_fly.value), item(Itm.gadget_net.value, Itm.gadget_club.value))
+with_requirements(can_qj, item(Itm.gadget_club.value),
+                  item(Itm.gadget_net.value, Itm.gadget_radar.value, Itm.gadget_hoop.value, Itm.gadget_rcc.value,
+                       Itm.gadget_fly.value))
+with_requirements(can_glitch_float, item(Itm.gadget_net.value), item(Itm.gadget_sling.value))
+with_requirements(can_glitch_float_morph, item(Itm.morph_ninja.value, Itm.morph_monkey.value))
+
+with_requirements(is_goal_achieved, item(APHelper.victory.value))
 
 ### [< --- WRAPPER SHORTHAND --- >]
 class AccessRule:
@@ -235,7 +319,7 @@ class AccessRule:
     FARM_DUPE = can_farm_sneaky_borgs()
 
     # NULL
-    NULL = (lambda state, player : False)
+    NULL = with_requirements(lambda state, player : False, item())          # An empty set can never be satisfied
 
     # Glitches
     BOOST_JUMP = can_boost_jump                 # Can Boost Jump
@@ -247,6 +331,199 @@ class AccessRule:
     # Victory
     GOAL = is_goal_achieved
 
+### [< --- RULE COMPILATION --- >]
+class RuleClause(NamedTuple):
+    """Requirements that must all be met, gathered from a group of access rules."""
+    any_of : frozenset[frozenset[str]]
+    counts : frozenset[tuple[str, int]]
+    calls : frozenset[Callable]
+
+    @classmethod
+    def of(cls, rules : Iterable[Callable]) -> "RuleClause":
+        any_of : set[frozenset[str]] = set()
+        counts : dict[str, int] = {}
+        calls : set[Callable] = set()
+
+        for rule in rules:
+            requirements : Sequence[Requirement] = getattr(rule, "requirements", None)
+            if requirements is None:
+                calls.add(rule)
+                continue
+
+            for requirement in requirements:
+                if isinstance(requirement, frozenset):
+                    any_of.add(requirement)
+                    continue
+
+                name, count = requirement
+                if count == 1:
+                    any_of.add(frozenset({name}))
+                elif count > 1:
+                    counts[name] = max(counts.get(name, 0), count)
+
+        # Having any Item of a set is implied by having one of a smaller set within it, or by needing several of one
+        any_of = {names for names in any_of
+                  if not any(other < names for other in any_of) and names.isdisjoint(counts)}
+
+        return cls(frozenset(any_of), frozenset(counts.items()), frozenset(calls))
+
+    def __bool__(self) -> bool:
+        return bool(self.any_of) or bool(self.counts) or bool(self.calls)
+
+    @property
+    def cost(self) -> int:
+        return (sum(1 if len(names) == 1 else 2 for names in self.any_of) + 2 * len(self.counts) +
+                8 * len(self.calls))
+
+    def implies(self, names : frozenset[str]) -> bool:
+        return any(other <= names for other in self.any_of) or any(name in names for name, _ in self.counts)
+
+    def covers(self, other : "RuleClause") -> bool:
+        """Whether meeting this clause always meets the other as well."""
+        counts : dict[str, int] = dict(self.counts)
+        return (all(self.implies(names) for names in other.any_of) and
+                all(counts.get(name, 0) >= count for name, count in other.counts) and
+                other.calls <= self.calls)
+
+    def without(self, other : "RuleClause") -> "RuleClause":
+        """Drop requirements that are already met whenever the other clause is."""
+        counts : dict[str, int] = dict(other.counts)
+        return RuleClause(frozenset(names for names in self.any_of if not other.implies(names)),
+                          frozenset((name, count) for name, count in self.counts if counts.get(name, 0) < count),
+                          self.calls - other.calls)
+
+    @property
+    def is_equipment_only(self) -> bool:
+        return not self.counts and not self.calls and all(names and names <= EQUIPMENT_BITS.keys()
+                                                          for names in self.any_of)
+
+    def flatten(self) -> tuple[int, tuple[int, ...], tuple[str, ...], tuple[tuple[str, ...], ...],
+                               tuple[tuple[str, int], ...], tuple[Callable, ...]]:
+        """
+        Get the clause as plain values for evaluation. Requirements on Equipment become bits checked against the
+        Equipment mask, and are checked first, followed by other Items, then counts, then calls.
+        """
+        equipment : list[frozenset[str]] = [names for names in self.any_of if names and names <= EQUIPMENT_BITS.keys()]
+        others : list[frozenset[str]] = [names for names in self.any_of if names not in equipment]
+
+        required_bits : int = to_equipment_bits(next(iter(names)) for names in equipment if len(names) == 1)
+        any_bits : tuple[int, ...] = tuple(to_equipment_bits(names) for names in
+                                           sorted((names for names in equipment if len(names) > 1), key=len))
+
+        required : tuple[str, ...] = tuple(sorted(next(iter(names)) for names in others if len(names) == 1))
+        any_of : tuple[tuple[str, ...], ...] = tuple(sorted((tuple(sorted(names)) for names in others
+                                                             if len(names) != 1), key=lambda names : len(names)))
+
+        return required_bits, any_bits, required, any_of, tuple(sorted(self.counts)), tuple(self.calls)
+
+def is_clause_met(clause : tuple, items : Counter[str], state : CollectionState, player : int) -> bool:
+    required_bits, any_bits, required, any_of, counts, calls = clause
+
+    mask : int = items[APHelper.equipment_mask.value]
+    if mask & required_bits != required_bits:
+        return False
+
+    for bits in any_bits:
+        if not mask & bits:
+            return False
+
+    for name in required:
+        if not items[name]:
+            return False
+
+    for names in any_of:
+        for name in names:
+            if items[name]:
+                break
+        else:
+            return False
+
+    for name, count in counts:
+        if items[name] < count:
+            return False
+
+    for rule in calls:
+        if not rule(state, player):
+            return False
+
+    return True
+
+def reduce_clauses(critical : RuleClause, alternatives : list[RuleClause]) -> list[RuleClause]:
+    """Simplify the alternatives to a critical clause, where at least one of the alternatives must be met."""
+    # Requirements already met by the critical clause need not be checked again
+    if critical:
+        alternatives = [clause.without(critical) for clause in alternatives]
+
+    # If any alternative has nothing left to check, the alternatives as a whole are always met
+    if not all(alternatives):
+        alternatives = []
+
+    # Drop duplicate alternatives and any that cannot be met without also meeting another
+    reduced : list[RuleClause] = []
+    for clause in sorted(set(alternatives), key=lambda c : c.cost):
+        if not any(clause.covers(other) for other in reduced):
+            reduced.append(clause)
+
+    return reduced
+
+def compile_clauses(critical : RuleClause, reduced : list[RuleClause]) -> Callable[[CollectionState, int], bool]:
+    """Build a single evaluator for a critical clause, and simplified alternatives where at least one must be met."""
+    flat_critical : tuple = critical.flatten()
+    flat_alternatives : tuple = tuple(clause.flatten() for clause in reduced)
+
+    if not critical and not flat_alternatives:
+        return lambda state, player : True
+
+    # When only Equipment is asked for, the result depends on the Equipment mask alone,
+    # and is kept in a truth table filled in as each mask is first seen
+    if all(clause.is_equipment_only for clause in (critical, *reduced) if clause):
+        table : dict[int, bool] = {}
+
+        def evaluate_equipment(state : CollectionState, player : int) -> bool:
+            mask : int = state.prog_items[player][APHelper.equipment_mask.value]
+            if mask not in table:
+                table[mask] = evaluate(state, player)
+
+            return table[mask]
+    else:
+        evaluate_equipment = None
+
+    def evaluate(state : CollectionState, player : int) -> bool:
+        items : Counter[str] = state.prog_items[player]
+
+        if not is_clause_met(flat_critical, items, state, player):
+            return False
+
+        if not flat_alternatives:
+            return True
+
+        for clause in flat_alternatives:
+            if is_clause_met(clause, items, state, player):
+                return True
+
+        return False
+
+    return evaluate_equipment or evaluate
+
+# Compiled rules are shared by every Rulesets with the same requirements, across all players. Entries are dropped
+# once nothing uses them anymore.
+COMPILED_RULES : weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+CONDENSED_RULES : weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+def intern_clauses(critical : RuleClause, alternatives : list[RuleClause]) \
+        -> tuple[tuple[RuleClause, frozenset[RuleClause]], Callable[[CollectionState, int], bool]]:
+    """Get the shared evaluator for the given clauses, compiling it if there is none yet."""
+    reduced : list[RuleClause] = reduce_clauses(critical, alternatives)
+    key : tuple[RuleClause, frozenset[RuleClause]] = (critical, frozenset(reduced))
+
+    evaluate : Callable[[CollectionState, int], bool] = COMPILED_RULES.get(key)
+    if evaluate is None:
+        evaluate = compile_clauses(critical, reduced)
+        COMPILED_RULES[key] = evaluate
+
+    return key, evaluate
+
+
 ### [< --- MANAGING CLASS --- >]
 class Rulesets:
     """
@@ -290,11 +567,14 @@ class Rulesets:
             self.critical.update(rulesets.critical)
 
         if rulesets.rules:
-            for i, rule in enumerate(rulesets.rules):
-                if rule in self.rules:
-                    rulesets.rules.pop(i)
+            existing : set[frozenset[Callable]] = {frozenset(rules) for rules in self.rules}
+            for rules in rulesets.rules:
+                key : frozenset[Callable] = frozenset(rules)
+                if key in existing:
+                    continue
 
-            self.rules.extend(rulesets.rules)
+                existing.add(key)
+                self.rules.append(rules)
 
     def check(self, state : CollectionState, player : int) -> bool:
         # Any Critical Rules that return False should immediately mark the item as inaccessible with the current state
@@ -317,10 +597,40 @@ class Rulesets:
 
         return reachable
 
+    def compile(self) -> Callable[[CollectionState, int], bool]:
+        """
+        Flatten the Rulesets into a single evaluator that gives the same result as check. Any changes made to the
+        Rulesets afterward are not reflected in it.
+        """
+        return self.intern()[1]
+
+    def intern(self) -> tuple[tuple, Callable[[CollectionState, int], bool]]:
+        return intern_clauses(RuleClause.of(self.critical), [RuleClause.of(rules) for rules in self.rules])
+
+    def get_regions(self) -> frozenset[str]:
+        """
+        Get the Regions the compiled Rulesets checks the reachability of. Rules not described by with_regions are
+        taken to only ask for Items.
+        """
+        (critical, reduced), _ = self.intern()
+        return frozenset(region for clause in (critical, *reduced) for rule in clause.calls
+                         for region in getattr(rule, "regions", ()))
+
     def condense(self, player) -> Callable[[CollectionState], bool]:
-        return lambda state : self.check(state, player)
+        key, evaluate = self.intern()
+
+        # Identical Rulesets of the same player share one access rule
+        condensed : Callable[[CollectionState], bool] = CONDENSED_RULES.get((key, player))
+        if condensed is None:
+            condensed = lambda state : evaluate(state, player)
+            CONDENSED_RULES[(key, player)] = condensed
+
+        return condensed
 
 
+# Index of each Channel in the vanilla order
+LEVEL_INDICES : dict[str, int] = {channel : i for i, channel in enumerate(LEVELS_BY_ORDER)}
+
 class ProgressionMode:
     name : str = "Generic Progression Mode"
     progression : list[int] = None
@@ -352,55 +662,39 @@ class ProgressionMode:
         self.regenerate_level_select_entrances()
 
     def generate_new_order(self, world : 'AE3World') -> list[int]:
-        new_order : list[int] = [_ for _ in range(28)]
-        world.random.shuffle(new_order)
-
         self.small_starting_channels = world.logic_preference.small_starting_channels.copy()
 
-        # Do not allow Bosses or problematic levels to be in the first few levels
-        if (len(set(new_order[:5]).intersection(self.small_starting_channels)) > 0 or
-               len(set(new_order[:3]).intersection([*self.boss_indices, *self.small_starting_channels])) > 0):
-            blacklists : list[int] = [*self.small_starting_channels, *self.boss_indices]
-            swap_indexes : list[int] = [ _ for _ in range(7, 26) if new_order[_] not in blacklists ]
-            for idx, level in enumerate(new_order):
-                if level not in blacklists:
-                    continue
-
-                if idx > 3 and len(blacklists) > len(self.small_starting_channels):
-                    blacklists = [*self.small_starting_channels]
+        # Channels preserved in their vanilla indices are left out of the shuffle, and re-inserted afterward
+        preserve_indices : list[int] = sorted(LEVEL_INDICES[channel] for channel in world.options.preserve_channel)
+        preserved : set[int] = {*preserve_indices}
 
-                swap : int = -1
-                swap_idx : int = -1
-                while swap < 0 or swap in blacklists:
-                    if not swap_indexes:
-                        break
+        pool : list[int] = [_ for _ in range(28) if _ not in preserved]
+        world.random.shuffle(pool)
 
-                    swap_idx = world.random.choice(swap_indexes)
-                    swap = new_order[swap_idx]
+        # Do not allow Bosses or problematic levels to be in the first few levels.
+        # The first slots are filled from the shuffled pool with only the channels allowed there,
+        # so the order is valid from the start and never needs to be retried or swapped around
+        small_starting : set[int] = {*self.small_starting_channels}
+        new_order : list[int] = []
+        for slots, blacklist in ((3, small_starting.union(self.boss_indices)), (2, small_starting)):
+            picked : list[int] = [_ for _ in pool if _ not in blacklist][:slots]
+            new_order.extend(picked)
 
-                new_order[idx], new_order[swap_idx] = new_order[swap_idx], new_order[idx]
+            picked_set : set[int] = {*picked}
+            pool = [_ for _ in pool if _ not in picked_set]
 
-                if swap_idx in swap_indexes:
-                    swap_indexes.remove(swap_idx)
+        new_order.extend(pool)
 
-                if idx >= 5: break
         # Re-insert Channels specified to be preserved in their vanilla indices
-        if world.options.preserve_channel:
-            preserve_indices : list[int] = [
-                LEVELS_BY_ORDER.index(channel) for channel in sorted(world.options.preserve_channel)
-            ]
-
-            if preserve_indices:
-                new_order = [_ for _ in new_order if _ not in preserve_indices]
-
-                for index in preserve_indices:
-                    new_order.insert(index, index)
+        for index in preserve_indices:
+            new_order.insert(index, index)
 
         # Apply the chosen Shuffle Mode
         if world.options.shuffle_channel == 1:
-            new_boss_order: list[int] = [_ for _ in new_order if _ in self.boss_indices]
+            bosses : set[int] = {*self.boss_indices}
+            new_boss_order: list[int] = [_ for _ in new_order if _ in bosses]
 
-            new_order = [_ for _ in new_order if _ not in self.boss_indices]
+            new_order = [_ for _ in new_order if _ not in bosses]
 
             for index in range(len(self.boss_indices)):
                 new_order.insert(self.boss_indices[index], new_boss_order[index])
@@ -408,7 +702,7 @@ class ProgressionMode:
         return new_order
 
     def reorder(self, set_interest : int, channels : list[str]):
-        temp_progression = deepcopy(self.progression)
+        temp_progression : list[int] = [*self.progression]
         # In the presence of padding sets, remove them first
         # Any ProgressionModes that requires the padding will handle putting it back themselves
         if 0 in self.progression[1:-1]:
@@ -419,20 +713,19 @@ class ProgressionMode:
         if set_interest < 0:
             set_interest = len(temp_progression) + set_interest
 
-        targets : list[int] = [
-            LEVELS_BY_ORDER.index(channel) for channel in channels
-            if channel in LEVELS_BY_ORDER
-        ].copy()
+        targets : list[int] = [LEVEL_INDICES[channel] for channel in channels if channel in LEVEL_INDICES]
 
         if not targets:
             return
 
-        self.progression = deepcopy(temp_progression)
+        self.progression = temp_progression
 
         additive = APHelper.additive.value in channels
+        target_set : set[int] = {*targets}
 
-        # Group the Sets
+        # Group the Sets, keeping track of their sizes before the targets are taken out of them
         group_set : list[list[int]] = []
+        group_sizes : list[int] = []
         count : int = 0
         for i, channel_set in enumerate(self.progression):
             offset : int = 0
@@ -440,8 +733,8 @@ class ProgressionMode:
                 offset = 1
 
             target : int = count + channel_set + offset
-            group_set.append([_ if _ not in targets else -1
-                              for _ in self.order[count : target]])
+            group_set.append([_ for _ in self.order[count : target] if _ not in target_set])
+            group_sizes.append(len(self.order[count : target]))
             count = target
 
         if additive:
@@ -452,27 +745,18 @@ class ProgressionMode:
             if set_interest <= 1:
                 set_interest += 1
 
-            # Create Temporary Values
-            temp_order : list[int] = [channel for sets in group_set[:set_interest]
-                                      for channel in sets if channel != -1]
-            temp_progression : list[int] = [len(_) for _ in group_set[:set_interest]]
-            temp_set : list[list[int]] = []
-
-            # Regenerate Group Set with new order for all the interest set and all sets before it
+            # Regenerate Group Set with new order for all the sets before the interest set,
+            # filling the slots left by the targets with the channels after them
+            temp_order : list[int] = [channel for sets in group_set[:set_interest] for channel in sets]
             if temp_order:
                 count : int = 0
-                for i, channel_set in enumerate(temp_progression):
-                    target : int = count + channel_set
-                    temp_set.append([_ for _ in temp_order[count : target]])
+                temp_set : list[list[int]] = []
+                for size in group_sizes[:set_interest]:
+                    target : int = count + size
+                    temp_set.append(temp_order[count : target])
                     count = target
 
-                temp_set.extend(group_set[set_interest:])
-                group_set = deepcopy(temp_set)
-
-        # Clean Up
-        for i, sets in enumerate(group_set):
-            if -1 in sets:
-                group_set[i] = [_ for _ in sets if _ != -1]
+                group_set[:set_interest] = temp_set
 
         new_order : list[int] = [channel for sets in group_set for channel in sets]
         new_progression : list[int] = []
@@ -487,21 +771,8 @@ class ProgressionMode:
 
             new_progression.append(amount)
 
-        self.order = deepcopy(new_order)
-        self.progression = deepcopy(new_progression)
-
-    @property
-    def pgc_entrance_names(self) -> set[str]:
-        post_game_set_idx = len(self.progression) - 2
-        if post_game_set_idx <= 0 or self.progression[post_game_set_idx] <= 0:
-            return set()
-
-        total_before = sum(self.progression[:post_game_set_idx]) + 1
-        return {
-            self.level_select_entrances[total_before + ch].name
-            for ch in range(self.progression[post_game_set_idx])
-            if total_before + ch < len(self.level_select_entrances)
-        }
+        self.order = new_order
+        self.progression = new_progression
 
     def generate_rules(self, world : 'AE3World') -> dict[str, Rulesets]:
         channel_rules : dict[str, Rulesets] = {}
@@ -575,6 +846,10 @@ class ProgressionMode:
 
         return unlocked
 
+    def get_excluded_locations(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Get the Locations of the Blacklisted Channels and of the Post Game Channels."""
+        return get_channel_exclusions(tuple(self.order), tuple(self.progression))
+
 
 class Singles(ProgressionMode):
     def __init__(self, world : 'AE3World' = None):
@@ -595,9 +870,10 @@ class Group(ProgressionMode):
         new_order : list[int] = self.generate_new_order(world)
 
         ## Pre-emptively remove Blacklisted Channels
-        blacklist : list[int] = [LEVELS_BY_ORDER.index(channel) for channel in sorted(world.options.blacklist_channel)
-                                 if channel in LEVELS_BY_ORDER]
-        new_order : list[int] = [_ for _ in new_order if _ not in blacklist]
+        blacklist : list[int] = [LEVEL_INDICES[channel] for channel in sorted(world.options.blacklist_channel)
+                                 if channel in LEVEL_INDICES]
+        blacklist_set : set[int] = {*blacklist}
+        new_order : list[int] = [_ for _ in new_order if _ not in blacklist_set]
 
         # Track channel being processed to create the new progression.
         new_progression : list[int] = [-1]
@@ -665,10 +941,11 @@ class World(ProgressionMode):
         new_order : list[int] = self.generate_new_order(world)
 
         # Pre-emptively remove Blacklisted Channels
-        blacklist : list[int] = [LEVELS_BY_ORDER.index(channel) for channel in sorted(world.options.blacklist_channel)
-                                 if channel in LEVELS_BY_ORDER]
+        blacklist : list[int] = [LEVEL_INDICES[channel] for channel in sorted(world.options.blacklist_channel)
+                                 if channel in LEVEL_INDICES]
+        blacklist_set : set[int] = {*blacklist}
         if blacklist:
-            new_order = [_ for _ in new_order if _ not in blacklist]
+            new_order = [_ for _ in new_order if _ not in blacklist_set]
 
         # Track channel being processed to create the new progression.
         new_progression : list[int] = [-1]
@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, Callable, Set, ClassVar
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, Mapping, Optional, Set, ClassVar
 from dataclasses import dataclass, field
+from weakref import WeakKeyDictionary
 from warnings import warn
 import math
 
@@ -7,12 +8,12 @@ from BaseClasses import CollectionState
 from Options import OptionError
 
 from .Locations import CAMERAS_INDEX, CAMERAS_MASTER, CELLPHONES_INDEX, Cellphone_Name_to_ID, MONKEYS_BOSSES, \
-    MONKEYS_BREAK_ROOMS, MONKEYS_INDEX, MONKEYS_MASTER, MONKEYS_PASSWORDS, generate_name_to_id, LOCATIONS_INDEX, \
+    MONKEYS_BREAK_ROOMS, MONKEYS_INDEX, MONKEYS_MASTER, MONKEYS_PASSWORDS, get_location_tables, LOCATIONS_INDEX, \
     LOCATIONS_DIRECTORY, SHOP_CHEAP_COLLECTION_INDEX, SHOP_CHEAP_MASTER, SHOP_PROGRESSION_DIRECTORY, SHOP_UNIQUE_MASTER, \
     SHOP_COLLECTION_MASTER, SHOP_PERSISTENT_MASTER, SHOP_CHEAP_COLLECTION_MASTER, SHOP_EVENT_ACCESS_DIRECTORY, \
     MONKEYS_INFINITE_GADGET_FLOAT_APPLICABLE, EVENTS_INFINITE_GADGET_FLOAT_APPLICABLE
 from .Logic import Rulesets, AccessRule, has_keys, event_invoked, has_enough_keys, can_access_region, \
-    has_shop_stock, has_morph_stocks, has_morph_extensions, can_farm_boxes, can_farm_sneaky_borgs
+    has_shop_stock, has_morph_stocks, has_morph_extensions, can_farm_boxes, can_farm_sneaky_borgs, with_regions
 from .Strings import Loc, Stage, Events, APHelper
 from .Stages import (STAGES_DIRECTORY, STAGES_DIRECTORY_LABEL, ENTRANCES_SHOP_PSEUDOREGIONS, AE3EntranceMeta,
                      ENTRANCES_SHOP_PROGRESSION, STAGES_SHOP_PROGRESSION, STAGES_FARMABLE, STAGES_FARMABLE_SNEAKY_BORG,
@@ -22,6 +23,61 @@ if TYPE_CHECKING:
     from ..AE3_Client import AE3Context
     from .. import AE3World, AE3Options
 
+CAMERA_STAGES : dict[str, str] = {camera : stage for stage, camera in CAMERAS_INDEX.items()}
+
+
+class ReachabilityCache:
+    """
+    Locations known to be reachable with each CollectionState. As collecting Items can only make more Locations
+    reachable, only those that were not are checked again when the state changes, and everything is only checked
+    over when an Item has been removed from the state.
+
+    Relies on the state version and removal counts kept by AE3World.collect and AE3World.remove. As Regions are also
+    reached while the state sweeps for them without any Item being collected, the number of reachable Regions is kept
+    alongside the version, so that Locations are checked again whenever either changes.
+    """
+    locations : tuple[str, ...]
+
+    # State -> Player -> [(version, reachable regions), removals, reached, pending]
+    states : WeakKeyDictionary
+
+    def __init__(self, locations : Iterable[str]):
+        self.locations = tuple(locations)
+        self.states = WeakKeyDictionary()
+
+    def count(self, state : CollectionState, player : int, target : int) -> int:
+        """Count reachable Locations, stopping early once the target is met."""
+        items = state.prog_items[player]
+        version : int = items[APHelper.state_version.value]
+        removals : int = items[APHelper.state_removals.value]
+
+        entries : dict[int, list] = self.states.setdefault(state, {})
+        entry : list = entries.get(player)
+        if entry is None or entry[1] != removals:
+            entry = [None, removals, set(), [*self.locations]]
+            entries[player] = entry
+
+        reached : set[str] = entry[2]
+        if len(reached) >= target:
+            return len(reached)
+
+        # Taken before checking, as checking Locations may reach more Regions that then need to be checked again
+        key : tuple[int, int] = (version, len(state.reachable_regions[player]))
+        if entry[0] == key:
+            return len(reached)
+
+        for location in entry[3]:
+            if state.can_reach_location(location, player):
+                reached.add(location)
+
+                if len(reached) >= target:
+                    break
+
+        entry[0] = key
+        entry[3] = [location for location in entry[3] if location not in reached]
+
+        return len(reached)
+
 
 class GoalTarget:
     name : str = "Empty Goal"
@@ -31,6 +87,7 @@ class GoalTarget:
     location_ids : set[int] = {}
 
     amount : int = 0
+    reachability : Optional[ReachabilityCache] = None
 
     def __init__(self, amount : int = 0, excluded_stages : list[str] = None, excluded_locations : list[str] = None,
                  shop_mode : int = 1):
@@ -82,7 +139,8 @@ class GoalTarget:
                      " Number of Locations required to check for Goal has been reduced due to excluded locations.")
                 self.amount = len(self.locations)
 
-        self.location_ids = {generate_name_to_id()[location] for location in self.locations}
+        to_id : Mapping[str, int] = get_location_tables().name_to_id
+        self.location_ids = {to_id[location] for location in self.locations}
 
         if amount and amount < 101:
             mod: float = amount / 100
@@ -104,17 +162,19 @@ class GoalTarget:
     def exclude(self, locations : list[str] = None):
         if locations is None or not locations:
             self.locations = { location for location in self.locations if location not in locations }
-            self.location_ids = {generate_name_to_id()[location] for location in self.locations}
+            to_id : Mapping[str, int] = get_location_tables().name_to_id
+            self.location_ids = {to_id[location] for location in self.locations}
 
     def append(self, *locations : str):
         self.locations = { * self.locations, *locations }
 
     async def check(self, ctx : 'AE3Context'):
-        checked: set[int] = ctx.locations_checked.copy()
-
-        if len(self.location_ids.intersection(checked)) >= self.amount and not ctx.game_goaled:
+        if self.is_reached(ctx) and not ctx.game_goaled:
             await ctx.goal()
 
+    def is_reached(self, ctx : 'AE3Context') -> bool:
+        return len(self.location_ids.intersection(ctx.locations_checked)) >= self.amount
+
     def get_progress(self, ctx : 'AE3Context') -> int:
         checked: set[int] = ctx.locations_checked
         progress : int = len(self.location_ids.intersection(checked))
@@ -125,22 +185,16 @@ class GoalTarget:
         checked: set[int] = ctx.locations_checked
         progressed : set[int] = self.location_ids.intersection(checked)
 
-        name_to_id : dict[str, int] = generate_name_to_id()
+        name_to_id : Mapping[str, int] = get_location_tables().name_to_id
         remaining : list[str] = [ l for l in self.locations if name_to_id[l] not in progressed]
 
         return remaining
 
     def verify(self, state : CollectionState, player : int) -> bool:
-        checks : int = 0
-        for location in self.locations:
-            if not state.can_reach_location(location, player):
-                continue
+        if self.reachability is None:
+            self.reachability = ReachabilityCache(self.locations)
 
-            checks += 1
-            if checks >= self.amount:
-                return True
-
-        return False
+        return self.reachability.count(state, player, self.amount) >= self.amount
 
     def enact(self) -> Callable[[CollectionState, int], bool]:
         return lambda state, player : self.verify(state, player)
@@ -155,6 +209,8 @@ class PostGameCondition:
     location_ids: dict[str, set[int]] = field(default_factory=dict)
     amounts : dict[str, int] = field(default_factory=dict)
 
+    camera_reachability : Optional[ReachabilityCache] = None
+
     location_categories : ClassVar[list[str]] = [APHelper.monkey.value,
                                                  APHelper.bosses.value,
                                                  APHelper.camera.value,
@@ -194,7 +250,7 @@ class PostGameCondition:
             excluded_locations.extend(set(SHOP_COLLECTION_MASTER).difference(SHOP_PERSISTENT_MASTER))
 
         # Define valid locations for checking
-        to_id : dict[str, int] = generate_name_to_id()
+        to_id : Mapping[str, int] = get_location_tables().name_to_id
 
         for category in self.location_categories:
             if category in self.amounts:
@@ -232,10 +288,11 @@ class PostGameCondition:
                 rules.add(AccessRule.MONKEY)
 
         if APHelper.camera.value in self.amounts:
-            count : int = sum([state.can_reach_location(camera, player)
-                           for camera in self.locations[APHelper.camera.value]])
+            if self.camera_reachability is None:
+                self.camera_reachability = ReachabilityCache(self.locations[APHelper.camera.value])
 
-            if count < self.amounts[APHelper.camera.value]:
+            amount : int = self.amounts[APHelper.camera.value]
+            if self.camera_reachability.count(state, player, amount) < amount:
                 return False
 
         if APHelper.cellphone.value in self.amounts:
@@ -259,7 +316,10 @@ class PostGameCondition:
         return True
 
     def enact(self, min_keys : int, break_rooms : int = 0) -> Callable[[CollectionState, int], bool]:
-        return lambda state, player : self.verify(state, player, min_keys, break_rooms)
+        # Counting Cameras checks the reachability of the Stages they are in
+        regions : list[str] = [CAMERA_STAGES[camera] for camera in self.locations.get(APHelper.camera.value, ())]
+
+        return with_regions(lambda state, player : self.verify(state, player, min_keys, break_rooms), *regions)
 
     def check(self, ctx : 'AE3Context') -> bool:
         # If already passed, use the cached status instead of checking everything again
@@ -309,15 +369,79 @@ class PostGameCondition:
     def get_remaining(self, ctx : 'AE3Context') -> dict[str, list[str]]:
         checked : set[int] = ctx.locations_checked
 
+        to_id : Mapping[str, int] = get_location_tables().name_to_id
+
         remaining : dict[str, list[str]] = {}
         for category in self.location_categories:
             if category in self.amounts:
                 remaining[category] = [location for location in self.locations[category]
-                                       if generate_name_to_id()[location] not in checked]
+                                       if to_id[location] not in checked]
 
         return remaining
 
 
+class ProgressTracker:
+    """
+    Keeps the status of the Goal and the Post Game Condition of a session, only evaluating them again when checked
+    Locations or Keys have changed. Listeners are notified when either status is first reached.
+
+    Events:
+        goal : Goal Target has been reached
+        pgc : Post Game Condition has been passed
+    """
+    version : int = 0
+    checked_version : int = 0
+    inputs : Optional[tuple[int, int, int]] = None
+
+    goal_reached : bool = False
+    pgc_passed : bool = False
+
+    listeners : dict[str, list[Callable[[], Awaitable[None]]]]
+
+    def __init__(self):
+        self.listeners = {}
+
+    def subscribe(self, event : str, callback : Callable[[], Awaitable[None]]):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def touch(self):
+        """Mark checked Locations as changed, for changes that might not alter the amount checked."""
+        self.checked_version += 1
+
+    def reset(self):
+        """Forget the last evaluated status, such as when the Goal Target or Post Game Condition are replaced."""
+        self.inputs = None
+        self.goal_reached = False
+        self.pgc_passed = False
+
+    async def update(self, ctx : 'AE3Context') -> int:
+        """Evaluate the Goal and Post Game Condition if anything they depend on changed. Returns the version."""
+        inputs : tuple[int, int, int] = (self.checked_version, len(ctx.locations_checked), ctx.keys)
+        if inputs == self.inputs and ctx.post_game_condition.passed == self.pgc_passed:
+            return self.version
+
+        self.inputs = inputs
+        self.version += 1
+
+        events : list[str] = []
+
+        pgc_passed : bool = ctx.post_game_condition.check(ctx)
+        if pgc_passed and not self.pgc_passed:
+            events.append("pgc")
+        self.pgc_passed = pgc_passed
+
+        goal_reached : bool = ctx.goal_target.is_reached(ctx)
+        if goal_reached and not self.goal_reached:
+            events.append("goal")
+        self.goal_reached = goal_reached
+
+        for event in events:
+            for callback in self.listeners.get(event, []):
+                await callback()
+
+        return self.version
+
+
 class LogicPreference:
     """
     Base Class for defined RuleTypes. RuleTypes determine the kinds of access rules locations or regions have
@@ -400,6 +524,10 @@ class LogicPreference:
         return
 
     def apply_option_logic(self, options: 'AE3Options'):
+        if options.shoppingsanity.value < 1:
+            self.apply_shop_disabled_logic(bool(options.farm_logic_sneaky_borgs.value))
+
+    def apply_shop_disabled_logic(self, farm_sneaky_borgs : bool):
         # Should be implemented by each LogicPreference as needed
         return
 
@@ -1224,13 +1352,12 @@ class Expert(Hard):
         for e in entrances:
             self.entrance_rules.get(e, Rulesets()).update(Rulesets(rules))
 
-    def apply_option_logic(self, options: 'AE3Options'):
-        if options.shoppingsanity.value < 1:
-            rules: list = [AccessRule.HERO, can_farm_boxes()]
-            if options.farm_logic_sneaky_borgs:
-                rules.append(can_farm_sneaky_borgs())
+    def apply_shop_disabled_logic(self, farm_sneaky_borgs : bool):
+        rules: list = [AccessRule.HERO, can_farm_boxes()]
+        if farm_sneaky_borgs:
+            rules.append(can_farm_sneaky_borgs())
 
-            self.entrance_rules.get(Stage.entrance_asia_e1e2.value, Rulesets()).update(Rulesets(rules))
+        self.entrance_rules.get(Stage.entrance_asia_e1e2.value, Rulesets()).update(Rulesets(rules))
 
 class Normal(Hard):
     """
@@ -1848,6 +1975,46 @@ LogicPreferenceOptions : list = [
     Expert
 ]
 
+# LogicPreferences are only built from static data and a few options, so players with the same options share one.
+# Keys are plain option values, so the same LogicPreference can also be rebuilt as-is in another process.
+LOGIC_PREFERENCE_CACHE : dict[tuple, LogicPreference] = {}
+
+def get_logic_preference_key(options : 'AE3Options') -> tuple:
+    """Get the option values that the LogicPreference of a player depends on, once they have been resolved."""
+    return (options.logic_preference.value,
+            bool(options.hip_drop_storage_logic.value),
+            bool(options.prolonged_quad_jump_logic.value),
+            options.base_morph_duration.value,
+            bool(options.add_morph_extensions.value),
+            options.shoppingsanity.value,
+            bool(options.farm_logic_sneaky_borgs.value))
+
+def build_logic_preference(preference : int, hds : bool, mqj : bool, base_morph_duration : int,
+                           morph_extensions : bool, shoppingsanity : int, farm_sneaky_borgs : bool) \
+        -> LogicPreference:
+    logic_preference : LogicPreference = LogicPreferenceOptions[preference]()
+    logic_preference.apply_unlimited_gadget_float_rules(hds, mqj)
+
+    if base_morph_duration >= 30 or morph_extensions:
+        logic_preference.apply_timed_kung_fu_rule(base_morph_duration, morph_extensions)
+        logic_preference.apply_timed_morph_float(base_morph_duration, morph_extensions)
+
+    if shoppingsanity < 1:
+        logic_preference.apply_shop_disabled_logic(farm_sneaky_borgs)
+
+    return logic_preference
+
+def get_logic_preference(options : 'AE3Options') -> LogicPreference:
+    """
+    Get the LogicPreference for the given options, shared with any other player with the same options.
+    The LogicPreference returned must not be modified.
+    """
+    key : tuple = get_logic_preference_key(options)
+    if key not in LOGIC_PREFERENCE_CACHE:
+        LOGIC_PREFERENCE_CACHE[key] = build_logic_preference(*key)
+
+    return LOGIC_PREFERENCE_CACHE[key]
+
 # [<--- SHOP ITEMS RULES HANDLING --->]
 @dataclass
 class ShopItemRules:
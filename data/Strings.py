@@ -2712,6 +2712,11 @@ class APHelper(BaseEnum):
 
     hints =                     "hints"
 
+    # Logic
+    equipment_mask =            "AE3 Equipment Mask"
+    state_version =             "AE3 State Version"
+    state_removals =            "AE3 State Removals"
+
     # Local Save
     last_itm_idx_prc =          "last_item_index_processed"
     checked_volatile_locations ="checked_volatile_locs"
@@ -2730,6 +2735,7 @@ class APHelper(BaseEnum):
     cmd_rcv =                   "ReceivedItems"
     cmd_rminfo =                "RoomInfo"
     cmd_rmupdt =                "RoomUpdate"
+    cmd_locinfo =               "LocationInfo"
     cmd_bounce =                "Bounced"
 
     arg_sl_dt =                 "slot_data"
@@ -2778,6 +2784,8 @@ class APConsole:
 
         init =          " [-/-] Successfully connected to PCSX2"
         init_game =     " [-/-] Connected to Ape Escape 3!"
+
+        hint_book =     " [-?-] Hint Book: {item} for {player} is at {location}."
         exit =          " [-/-] Disconnected from PCSX2."
 
     class Err(BaseEnum):
@@ -2793,5 +2801,6 @@ class APConsole:
         conf_game =     " [!!!] Please load a supported version of Ape Escape 3."
 
         save_fail =     " [!!!] There was an error saving the current Archipelago Session."
+        cache_fail =    " [!!!] There was an error writing the local session cache."
         save_no_init =  (" [!!!] The Client must have connected to the server at least once during the active session "
                          "to save.")
\ No newline at end of file
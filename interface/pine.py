@@ -14,6 +14,7 @@ performant.
 import os
 import struct
 from enum import IntEnum
+from typing import Sequence
 from platform import system
 import socket
 
@@ -237,6 +238,37 @@ class Pine:
                 self._send_request(request)
                 bytes_written += 1
 
+    def batch_read(self, requests: Sequence[tuple[IPCCommand, int]]) -> list[bytes]:
+        """ Reads several addresses in as few IPC messages as possible. Each request is a pair of a READ command and
+        an address, and the raw bytes of each read is returned in the same order as the requests. """
+        sizes = {Pine.IPCCommand.READ8: 1, Pine.IPCCommand.READ16: 2,
+                 Pine.IPCCommand.READ32: 4, Pine.IPCCommand.READ64: 8}
+        results: list[bytes] = []
+
+        for start in range(0, len(requests), Pine.MAX_BATCH_REPLY_COUNT):
+            batch = requests[start:start + Pine.MAX_BATCH_REPLY_COUNT]
+            body = b''.join(Pine.to_bytes(command, 1) + Pine.to_bytes(address, 4) for command, address in batch)
+            response = self._send_request(Pine.to_bytes(len(body) + 4, 4) + body)
+
+            # Replies are the values of each read concatenated after the size and result code
+            offset = 5
+            for command, _ in batch:
+                results.append(response[offset:offset + sizes[command]])
+                offset += sizes[command]
+
+        return results
+
+    def batch_write(self, requests: Sequence[tuple[IPCCommand, int, bytes]]) -> None:
+        """ Writes to several addresses in as few IPC messages as possible. Each request is a tuple of a WRITE command,
+        an address and the bytes to write, which must match the size of the command. """
+        request_size = 9 + Pine.DataSize.INT64
+
+        for start in range(0, len(requests), Pine.MAX_IPC_SIZE // request_size):
+            batch = requests[start:start + Pine.MAX_IPC_SIZE // request_size]
+            body = b''.join(Pine.to_bytes(command, 1) + Pine.to_bytes(address, 4) + data
+                            for command, address, data in batch)
+            self._send_request(Pine.to_bytes(len(body) + 4, 4) + body)
+
     def get_game_id(self) -> str:
         request = Pine.to_bytes(5, 4) + Pine.to_bytes(Pine.IPCCommand.ID, 1)
         response = self._send_request(request)
@@ -291,6 +323,20 @@ class Pine:
 
         return result
 
+    @staticmethod
+    def compose_write_bytes(address: int, data: bytes) -> list[tuple[IPCCommand, int, bytes]]:
+        """Splits a write of arbitrary length into requests for batch_write, mirroring write_bytes."""
+        requests: list[tuple[Pine.IPCCommand, int, bytes]] = []
+        bytes_written = 0
+        while bytes_written < len(data):
+            for size, command in ((8, Pine.IPCCommand.WRITE64), (4, Pine.IPCCommand.WRITE32),
+                                  (2, Pine.IPCCommand.WRITE16), (1, Pine.IPCCommand.WRITE8)):
+                if len(data) - bytes_written >= size:
+                    requests.append((command, address + bytes_written, data[bytes_written:bytes_written + size]))
+                    bytes_written += size
+                    break
+        return requests
+
     @staticmethod
     def _create_request(command: IPCCommand, address: int, size: int = 0) -> bytes:
         ipc = Pine.to_bytes(size, 4)
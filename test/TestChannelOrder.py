@@ -0,0 +1,164 @@
+from types import SimpleNamespace
+import unittest
+import random
+
+from ..data.Logic import ProgressionMode
+from ..data.Stages import LEVELS_BY_ORDER
+from ..data.Strings import APHelper
+
+
+def baseline_reorder(progression : list[int], order : list[int], set_interest : int, channels : list[str]) \
+        -> tuple[list[int], list[int]]:
+    """ProgressionMode.reorder as it was before it was rewritten, kept as the reference for its results."""
+    temp_progression : list[int] = [*progression]
+    if 0 in progression[1:-1]:
+        temp_progression = [progression[0], *[_ for _ in progression[1:-1] if _ > 0], progression[-1]]
+
+    if set_interest < 0:
+        set_interest = len(temp_progression) + set_interest
+
+    targets : list[int] = [LEVELS_BY_ORDER.index(channel) for channel in channels if channel in LEVELS_BY_ORDER]
+    if not targets:
+        return order, progression
+
+    progression = [*temp_progression]
+    additive : bool = APHelper.additive.value in channels
+
+    group_set : list[list[int]] = []
+    count : int = 0
+    for i, channel_set in enumerate(progression):
+        target : int = count + channel_set + (1 if i == 0 else 0)
+        group_set.append([_ if _ not in targets else -1 for _ in order[count : target]])
+        count = target
+
+    if additive:
+        group_set[set_interest].extend(targets)
+    else:
+        group_set.insert(set_interest + 1, targets)
+
+        if set_interest <= 1:
+            set_interest += 1
+
+        temp_order : list[int] = [channel for sets in group_set[:set_interest] for channel in sets if channel != -1]
+        temp_progression = [len(_) for _ in group_set[:set_interest]]
+        temp_set : list[list[int]] = []
+
+        if temp_order:
+            count = 0
+            for channel_set in temp_progression:
+                target : int = count + channel_set
+                temp_set.append([_ for _ in temp_order[count : target]])
+                count = target
+
+            temp_set.extend(group_set[set_interest:])
+            group_set = [[*sets] for sets in temp_set]
+
+    group_set = [[_ for _ in sets if _ != -1] for sets in group_set]
+
+    new_order : list[int] = [channel for sets in group_set for channel in sets]
+    new_progression : list[int] = []
+    for i, sets in enumerate(group_set):
+        amount : int = len(sets)
+
+        if amount == 0 and i < len(group_set) - 1:
+            continue
+
+        if not new_progression:
+            amount -= 1
+
+        new_progression.append(amount)
+
+    return new_order, new_progression
+
+
+def make_world(seed : int, small_starting_channels : list[int], preserve_channel : list[str] = (),
+               shuffle_channel : int = 0) -> SimpleNamespace:
+    return SimpleNamespace(random=random.Random(seed),
+                           logic_preference=SimpleNamespace(small_starting_channels=[*small_starting_channels]),
+                           options=SimpleNamespace(preserve_channel={*preserve_channel},
+                                                   shuffle_channel=shuffle_channel))
+
+
+class TestChannelOrder(unittest.TestCase):
+    trials : int = 2000
+
+    def setUp(self):
+        self.random = random.Random(0)
+
+    def generate(self, **kwargs) -> tuple[ProgressionMode, list[int], SimpleNamespace]:
+        small : list[int] = self.random.sample(range(28), self.random.randint(3, 9))
+        world : SimpleNamespace = make_world(self.random.getrandbits(32), small, **kwargs)
+        mode : ProgressionMode = ProgressionMode()
+
+        return mode, mode.generate_new_order(world), world
+
+    def test_order_is_permutation(self):
+        for _ in range(self.trials):
+            mode, order, world = self.generate()
+            self.assertEqual(sorted(order), [*range(28)])
+
+    def test_first_slots_avoid_bosses_and_small_channels(self):
+        for _ in range(self.trials):
+            mode, order, world = self.generate()
+            small : set[int] = {*world.logic_preference.small_starting_channels}
+
+            self.assertTrue(small.isdisjoint(order[:3]), order)
+            self.assertTrue({*mode.boss_indices}.isdisjoint(order[:3]), order)
+
+    def test_next_slots_avoid_small_channels(self):
+        for _ in range(self.trials):
+            mode, order, world = self.generate()
+            small : set[int] = {*world.logic_preference.small_starting_channels}
+
+            self.assertTrue(small.isdisjoint(order[3:5]), order)
+
+    def test_preserved_channels_keep_vanilla_index(self):
+        for _ in range(self.trials):
+            preserved : list[str] = self.random.sample(LEVELS_BY_ORDER, self.random.randint(1, 4))
+            mode, order, world = self.generate(preserve_channel=preserved)
+
+            self.assertEqual(sorted(order), [*range(28)])
+            for channel in preserved:
+                index : int = LEVELS_BY_ORDER.index(channel)
+                self.assertEqual(order[index], index, (channel, order))
+
+    def test_boss_shuffle_keeps_bosses_in_boss_slots(self):
+        for _ in range(self.trials):
+            mode, order, world = self.generate(shuffle_channel=1)
+
+            self.assertEqual(sorted(order), [*range(28)])
+            self.assertEqual({order[index] for index in mode.boss_indices}, {*mode.boss_indices}, order)
+
+    def test_reorder_matches_baseline(self):
+        for _ in range(self.trials * 5):
+            progression : list[int] = []
+            while sum(progression) < 27:
+                progression.append(min(self.random.randint(0, 6), 27 - sum(progression)))
+            if self.random.random() < 0.3:
+                progression.insert(self.random.randrange(1, len(progression)), 0)
+            progression.append(0)
+
+            order : list[int] = [*range(28)]
+            self.random.shuffle(order)
+
+            channels : list[str] = self.random.sample(LEVELS_BY_ORDER, self.random.randint(0, 6))
+            if self.random.random() < 0.3:
+                channels.append(APHelper.additive.value)
+            channels.sort()
+
+            set_interest : int = self.random.choice([-1, -2, -3])
+
+            mode : ProgressionMode = ProgressionMode()
+            mode.progression = [*progression]
+            mode.order = [*order]
+
+            try:
+                expected = baseline_reorder([*progression], [*order], set_interest, channels)
+            except IndexError:
+                with self.assertRaises(IndexError):
+                    mode.reorder(set_interest, channels)
+                continue
+
+            mode.reorder(set_interest, channels)
+            self.assertEqual((mode.order, mode.progression), expected,
+                             (progression, order, set_interest, channels))
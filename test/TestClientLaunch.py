@@ -0,0 +1,57 @@
+from importlib.util import find_spec
+import subprocess
+import unittest
+import sys
+import os
+
+PACKAGE : str = __package__.rpartition(".")[0]
+CLIENT : str = f"{PACKAGE}.AE3_Client"
+
+# Run in its own interpreter, so that nothing imported or built by other tests is counted
+IMPORT_CLIENT : str = f"""
+import {CLIENT} as client
+from {PACKAGE}.data import Locations
+
+print(client.AE3Context.__dict__["locations_name_to_id"].table is None,
+      client.AE3Context.__dict__["items_name_to_id"].table is None,
+      client.AE3Context.__dict__["location_groups"].table is None,
+      Locations.get_location_tables.cache_info().currsize == 0)
+"""
+
+
+def import_client() -> tuple[list[str], dict[str, tuple[int, int]]]:
+    """Import the client in a new interpreter, returning what it printed and the import time of each module in us."""
+    env : dict[str, str] = {**os.environ, "PYTHONPATH" : os.pathsep.join(sys.path), "AE3_CLIENT_HEADLESS" : "1"}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT_CLIENT],
+                            capture_output=True, text=True, env=env, check=True)
+
+    times : dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        own, cumulative, module = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            times[module.strip()] = (int(own), int(cumulative))
+
+    return result.stdout.split(), times
+
+
+@unittest.skipIf(find_spec("CommonClient") is None, "Archipelago is not available")
+class TestClientLaunch(unittest.TestCase):
+    def test_tables_not_built_on_import(self):
+        built, times = import_client()
+
+        self.assertIn(CLIENT, times)
+        self.assertEqual(built, ["True"] * 4, "Client tables were built while importing the client")
+
+
+if __name__ == "__main__":
+    # Report the modules that take the longest to import along with the client, e.g.
+    # python -m worlds.ae3.test.TestClientLaunch
+    _, import_times = import_client()
+    for name, (own_time, cumulative_time) in sorted(import_times.items(), key=lambda _ : -_[1][0])[:25]:
+        print(f"{own_time / 1000 : >9.2f} ms {cumulative_time / 1000 : >9.2f} ms  {name}")
+
+    if CLIENT in import_times:
+        print(f"\n{CLIENT} : {import_times[CLIENT][1] / 1000 : .2f} ms")
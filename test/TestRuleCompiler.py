@@ -0,0 +1,106 @@
+from collections import Counter
+from typing import Callable
+import unittest
+import random
+
+from ..data.Logic import AccessRule, Rulesets, RuleClause, ITEM_GROUPS, EQUIPMENT_BITS, to_equipment_bits, \
+    has_keys, has_morph_stocks, event_invoked
+from ..data.Strings import Itm, APHelper
+
+PLAYER : int = 1
+EVENTS : list[str] = ["Test Event A", "Test Event B"]
+OPAQUE_ITEM : str = "Test Opaque Item"
+
+
+class ItemState:
+    """Stand-in for CollectionState, with only what access rules ask of it."""
+    def __init__(self, items : Counter[str]):
+        self.prog_items : dict[int, Counter[str]] = {PLAYER : items}
+        items[APHelper.equipment_mask.value] = to_equipment_bits(name for name in EQUIPMENT_BITS if items[name])
+
+    def has(self, name : str, player : int, count : int = 1) -> bool:
+        return self.prog_items[player][name] >= count
+
+    def has_any(self, names : list[str], player : int) -> bool:
+        return any(self.prog_items[player][name] for name in names)
+
+    def has_all(self, names : list[str], player : int) -> bool:
+        return all(self.prog_items[player][name] for name in names)
+
+    def has_group(self, name : str, player : int, count : int = 1) -> bool:
+        return sum(self.prog_items[player][_] for _ in ITEM_GROUPS[name]) >= count
+
+    def has_from_list_unique(self, names : list[str], player : int, count : int) -> bool:
+        return sum(1 for name in names if self.prog_items[player][name]) >= count
+
+    def can_reach_region(self, region : str, player : int) -> bool:
+        return (len(region) + self.prog_items[player][OPAQUE_ITEM]) % 3 == 0
+
+
+def has_opaque(state : ItemState, player : int) -> bool:
+    # Not described with with_requirements, so compiled Rulesets have to call it as is
+    return state.prog_items[player][OPAQUE_ITEM] % 2 == 1
+
+PREDICATES : list[Callable] = [
+    *(rule for name, rule in vars(AccessRule).items() if name.isupper() and callable(rule)),
+    *(has_keys(_) for _ in range(1, 4)),
+    *(has_morph_stocks(_) for _ in range(1, 4)),
+    *(event_invoked(_) for _ in EVENTS),
+    has_opaque,
+]
+
+EQUIPMENT_PREDICATES : list[Callable] = [rule for rule in PREDICATES if RuleClause.of([rule]).is_equipment_only]
+
+ITEM_NAMES : list[str] = sorted({*EQUIPMENT_BITS, *(_ for names in ITEM_GROUPS.values() for _ in names),
+                                 Itm.ammo_boom.value, Itm.acc_morph_stock.value, APHelper.channel_key.value,
+                                 APHelper.victory.value, *EVENTS, OPAQUE_ITEM})
+
+
+class TestRuleCompiler(unittest.TestCase):
+    trials : int = 3000
+
+    def setUp(self):
+        self.random = random.Random(0)
+
+    def random_rules(self, predicates : list[Callable], most : int) -> list[Callable]:
+        return self.random.sample(predicates, self.random.randint(1, most))
+
+    def random_rulesets(self, predicates : list[Callable]) -> Rulesets:
+        critical : set[Callable] = {*self.random_rules(predicates, 3)} if self.random.random() < 0.5 else None
+        rules : list[list[Callable]] = [self.random_rules(predicates, 4) for _ in range(self.random.randint(0, 4))]
+
+        return Rulesets(rules, critical=critical) if rules else Rulesets(critical=critical)
+
+    def random_state(self) -> ItemState:
+        density : float = self.random.random()
+        return ItemState(Counter({name : self.random.randint(1, 3) for name in ITEM_NAMES
+                                  if self.random.random() < density}))
+
+    def assertEquivalent(self, rulesets : Rulesets, states : list[ItemState]):
+        compiled : Callable[[ItemState, int], bool] = rulesets.compile()
+        condensed : Callable[[ItemState], bool] = rulesets.condense(PLAYER)
+
+        for state in states:
+            expected : bool = bool(rulesets.check(state, PLAYER))
+            self.assertEqual(bool(compiled(state, PLAYER)), expected, (rulesets.critical, rulesets.rules))
+            self.assertEqual(bool(condensed(state)), expected, (rulesets.critical, rulesets.rules))
+
+    def test_compiled_matches_check(self):
+        for _ in range(self.trials):
+            self.assertEquivalent(self.random_rulesets(PREDICATES), [self.random_state() for _ in range(8)])
+
+    def test_equipment_only_matches_check(self):
+        self.assertTrue(EQUIPMENT_PREDICATES)
+
+        # The same states are evaluated more than once, so that results kept by the truth table are checked too
+        states : list[ItemState] = [self.random_state() for _ in range(16)]
+        for _ in range(self.trials):
+            rulesets : Rulesets = self.random_rulesets(EQUIPMENT_PREDICATES)
+            self.assertEquivalent(rulesets, [*states, *states])
+
+    def test_updated_rulesets_match_check(self):
+        for _ in range(self.trials // 3):
+            rulesets : Rulesets = self.random_rulesets(PREDICATES)
+            rulesets.update(self.random_rulesets(PREDICATES))
+
+            self.assertEquivalent(rulesets, [self.random_state() for _ in range(8)])